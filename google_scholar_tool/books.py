@@ -4,21 +4,44 @@ This module provides functions for searching Google Books using the Google Books
 Requires GOOGLE_BOOKS_API_KEY environment variable to be set.
 """
 
-import json
+import logging
 import os
 import urllib.parse
-import urllib.request
-from collections.abc import Iterator
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
 
+import urllib3
+
+from google_scholar_tool import __version__
+from google_scholar_tool.http_client import get_json
 from google_scholar_tool.logging_config import get_logger
+from google_scholar_tool.utils import json_dumps
 
 logger = get_logger(__name__)
 
 GOOGLE_BOOKS_API_URL = "https://www.googleapis.com/books/v1/volumes"
+GOOGLE_BOOKS_PAGE_SIZE = 40  # API max for maxResults
+MAX_CONCURRENT_REQUESTS = 4
+# Google APIs only serve gzip when the User-Agent contains "gzip"
+REQUEST_HEADERS = {
+    "Accept-Encoding": "gzip",
+    "User-Agent": f"google-scholar-tool/{__version__} (gzip)",
+}
+
+# Shared keep-alive connection pool: only the first request pays the TLS handshake
+_POOL = urllib3.PoolManager(num_pools=1, maxsize=MAX_CONCURRENT_REQUESTS, headers=REQUEST_HEADERS)
+
+# Citation templates, bound once so each citation is a single str.format call
+_APA_FMT = "{authors} ({year}). {title}. {publisher}.".format
+_MLA_FMT = "{authors}{sep}{title}. {publisher}, {year}.".format
+_CHICAGO_FMT = _MLA_FMT  # Same layout as MLA for books
+_HARVARD_FMT = "{authors} ({year}) {title}. {publisher}.".format
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Book:
     """Represents a Google Books volume."""
 
@@ -33,6 +56,26 @@ class Book:
     info_link: str | None
     isbn_10: str | None = None
     isbn_13: str | None = None
+    # Per-author (last name, first names, initials), split once for all citation styles
+    _author_parts: list[tuple[str, str, tuple[str, ...]]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Split author names once so each citation style can reuse the parts."""
+        author_parts = []
+        for author in self.authors:
+            # Collapse runs of whitespace (spaces, tabs) so names split like str.split()
+            name = " ".join(author.split())
+            # rpartition splits off the last name without a list of every word
+            firsts, _, last = name.rpartition(" ")
+            if firsts:
+                initials = tuple(f"{p[0]}." for p in firsts.split(" "))
+                author_parts.append((last, firsts, initials))
+            else:
+                author_parts.append((name, "", ()))
+        # Frozen dataclass: set the derived cache via object.__setattr__
+        object.__setattr__(self, "_author_parts", author_parts)
 
     @property
     def year(self) -> str:
@@ -46,61 +89,52 @@ class Book:
         """Return ISBN-13 if available, else ISBN-10."""
         return self.isbn_13 or self.isbn_10
 
+    # NOTE: Do not JIT these formatters with numba (@njit). They are pure string
+    # manipulation, which numba handles in object mode (slower than CPython) and
+    # without f-string support. Speedups belong in the cached _author_parts instead.
     def _format_authors_apa(self) -> str:
         """Format authors for APA style: Last, F. M., & Last, F. M."""
-        if not self.authors:
+        if not self._author_parts:
             return "Unknown Author"
-        formatted = []
-        for author in self.authors:
-            parts = author.split()
-            if len(parts) >= 2:
-                last = parts[-1]
-                initials = " ".join(f"{p[0]}." for p in parts[:-1])
-                formatted.append(f"{last}, {initials}")
-            else:
-                formatted.append(author)
+        formatted = [
+            f"{last}, {' '.join(initials)}" if initials else last
+            for last, _, initials in self._author_parts
+        ]
         if len(formatted) == 1:
             return formatted[0]
         if len(formatted) == 2:
             return f"{formatted[0]} & {formatted[1]}"
         return ", ".join(formatted[:-1]) + f", & {formatted[-1]}"
 
-    def _format_authors_mla(self) -> str:
-        """Format authors for MLA style: Last, First, and First Last."""
-        if not self.authors:
-            return "Unknown Author"
-        if len(self.authors) == 1:
-            parts = self.authors[0].split()
-            if len(parts) >= 2:
-                return f"{parts[-1]}, {' '.join(parts[:-1])}"
-            return self.authors[0]
-        if len(self.authors) == 2:
-            first = self.authors[0].split()
-            first_formatted = (
-                f"{first[-1]}, {' '.join(first[:-1])}" if len(first) >= 2 else first[0]
-            )
-            return f"{first_formatted}, and {self.authors[1]}"
-        first = self.authors[0].split()
-        first_formatted = f"{first[-1]}, {' '.join(first[:-1])}" if len(first) >= 2 else first[0]
-        return f"{first_formatted}, et al."
-
-    def _format_authors_chicago(self) -> str:
+    def _format_authors_mla(self) -> tuple[str, bool]:
+        """Format authors for MLA style: Last, First, and First Last.
+
+        Returns:
+            Formatted authors and whether the text already ends with a period
+        """
+        if not self._author_parts:
+            return "Unknown Author", False
+        last, firsts, _ = self._author_parts[0]
+        first_formatted = f"{last}, {firsts}" if firsts else last
+        if len(self._author_parts) >= 3:
+            return f"{first_formatted}, et al.", True
+        if len(self._author_parts) == 2:
+            first_formatted = f"{first_formatted}, and {self.authors[1]}"
+        # Names can end in a period themselves (initials, "Jr.")
+        return first_formatted, first_formatted.endswith(".")
+
+    def _format_authors_chicago(self) -> tuple[str, bool]:
         """Format authors for Chicago style: Last, First, and First Last."""
         return self._format_authors_mla()  # Same as MLA for books
 
     def _format_authors_harvard(self) -> str:
         """Format authors for Harvard style: Last, F.M. and Last, F.M."""
-        if not self.authors:
+        if not self._author_parts:
             return "Unknown Author"
-        formatted = []
-        for author in self.authors:
-            parts = author.split()
-            if len(parts) >= 2:
-                last = parts[-1]
-                initials = "".join(f"{p[0]}." for p in parts[:-1])
-                formatted.append(f"{last}, {initials}")
-            else:
-                formatted.append(author)
+        formatted = [
+            f"{last}, {''.join(initials)}" if initials else last
+            for last, _, initials in self._author_parts
+        ]
         if len(formatted) == 1:
             return formatted[0]
         if len(formatted) == 2:
@@ -113,40 +147,54 @@ class Book:
         Format: Author, A. A. (Year). Title of work: Capital letter for subtitle.
                 Publisher.
         """
-        authors = self._format_authors_apa()
-        publisher = self.publisher or "Publisher unknown"
-        return f"{authors} ({self.year}). {self.title}. {publisher}."
+        return _APA_FMT(
+            authors=self._format_authors_apa(),
+            year=self.year,
+            title=self.title,
+            publisher=self.publisher or "Publisher unknown",
+        )
 
     def cite_mla(self) -> str:
         """Generate MLA 9th edition citation.
 
         Format: Last, First. Title of Work. Publisher, Year.
         """
-        authors = self._format_authors_mla()
-        publisher = self.publisher or "Publisher unknown"
+        authors, ends_with_period = self._format_authors_mla()
         # Handle "et al." which already ends with a period
-        sep = " " if authors.endswith(".") else ". "
-        return f"{authors}{sep}{self.title}. {publisher}, {self.year}."
+        return _MLA_FMT(
+            authors=authors,
+            sep=" " if ends_with_period else ". ",
+            title=self.title,
+            publisher=self.publisher or "Publisher unknown",
+            year=self.year,
+        )
 
     def cite_chicago(self) -> str:
         """Generate Chicago 17th edition citation (Notes-Bibliography).
 
         Format: Last, First. Title of Work. Place: Publisher, Year.
         """
-        authors = self._format_authors_chicago()
-        publisher = self.publisher or "Publisher unknown"
+        authors, ends_with_period = self._format_authors_chicago()
         # Handle "et al." which already ends with a period
-        sep = " " if authors.endswith(".") else ". "
-        return f"{authors}{sep}{self.title}. {publisher}, {self.year}."
+        return _CHICAGO_FMT(
+            authors=authors,
+            sep=" " if ends_with_period else ". ",
+            title=self.title,
+            publisher=self.publisher or "Publisher unknown",
+            year=self.year,
+        )
 
     def cite_harvard(self) -> str:
         """Generate Harvard citation.
 
         Format: Last, F.M. (Year) Title of work. Publisher.
         """
-        authors = self._format_authors_harvard()
-        publisher = self.publisher or "Publisher unknown"
-        return f"{authors} ({self.year}) {self.title}. {publisher}."
+        return _HARVARD_FMT(
+            authors=self._format_authors_harvard(),
+            year=self.year,
+            title=self.title,
+            publisher=self.publisher or "Publisher unknown",
+        )
 
     def cite(self, style: str = "apa") -> str:
         """Generate citation in specified style.
@@ -160,15 +208,11 @@ class Book:
         Raises:
             ValueError: If style is not supported
         """
-        styles = {
-            "apa": self.cite_apa,
-            "mla": self.cite_mla,
-            "chicago": self.cite_chicago,
-            "harvard": self.cite_harvard,
-        }
-        if style.lower() not in styles:
-            raise ValueError(f"Unsupported style: {style}. Use: {', '.join(styles.keys())}")
-        return styles[style.lower()]()
+        try:
+            citer = _CITERS[style.lower()]
+        except KeyError:
+            raise ValueError(f"Unsupported style: {style}. Use: {', '.join(_CITERS)}") from None
+        return citer(self)
 
     def to_dict(self) -> dict[str, str | int | list[str] | None]:
         """Convert book to dictionary."""
@@ -188,12 +232,25 @@ class Book:
 
     def to_json(self) -> str:
         """Convert book to JSON string."""
-        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        return json_dumps(self.to_dict())
+
 
+# Citation style dispatch for Book.cite, built once instead of per call
+_CITERS: dict[str, Callable[[Book], str]] = {
+    "apa": Book.cite_apa,
+    "mla": Book.cite_mla,
+    "chicago": Book.cite_chicago,
+    "harvard": Book.cite_harvard,
+}
 
+
+@lru_cache(maxsize=1)
 def get_api_key() -> str:
     """Get Google Books API key from environment.
 
+    The key is read once per process; call get_api_key.cache_clear() after
+    changing GOOGLE_BOOKS_API_KEY at runtime.
+
     Returns:
         API key string
 
@@ -209,68 +266,155 @@ def get_api_key() -> str:
     return api_key
 
 
-def search_books(query: str, limit: int = 10) -> Iterator[Book]:
-    """Search Google Books for volumes.
+@lru_cache(maxsize=64)
+def _fetch_page(
+    query: str, api_key: str, start_index: int, max_results: int
+) -> tuple[dict[str, Any], ...]:
+    """Fetch a single page of volumes from the Google Books API.
+
+    Responses are cached per process, so repeating a query (for example with a
+    different --cite style) does not hit the network again. Failed requests
+    raise and are not cached.
 
     Args:
         query: Search query string
-        limit: Maximum number of results to return (max 40)
-
-    Yields:
-        Book objects matching the query
-
-    Raises:
-        ValueError: If API key is not set
-        urllib.error.URLError: If network request fails
+        api_key: Google Books API key
+        start_index: Index of the first result to return
+        max_results: Number of results to return (max 40)
 
-    Example:
-        >>> for book in search_books("machine learning", limit=5):
-        ...     print(book.title)
+    Returns:
+        Tuple of raw volume items (empty if the page has no results)
     """
-    api_key = get_api_key()
-
     params = urllib.parse.urlencode(
         {
             "q": query,
             "key": api_key,
-            "maxResults": min(limit, 40),  # API max is 40
+            "startIndex": start_index,
+            "maxResults": max_results,
         }
     )
 
     url = f"{GOOGLE_BOOKS_API_URL}?{params}"
-    logger.info("Searching books: %s (limit=%d)", query, limit)
-    logger.debug("Request URL: %s", url.replace(api_key, "***"))
+    data = get_json(_POOL, url, "Google Books API", api_key)
+    return tuple(data.get("items", []))
+
+
+def _page_requests(query: str, limit: int) -> list[tuple[str, int, int]]:
+    """Split a result limit into (query, startIndex, maxResults) page requests."""
+    return [
+        (query, start, min(GOOGLE_BOOKS_PAGE_SIZE, limit - start))
+        for start in range(0, limit, GOOGLE_BOOKS_PAGE_SIZE)
+    ]
+
+
+def _fetch_pages(
+    api_key: str, requests: list[tuple[str, int, int]]
+) -> list[tuple[dict[str, Any], ...]]:
+    """Fetch page requests in order, concurrently when there is more than one."""
+    if len(requests) <= 1:
+        return [_fetch_page(query, api_key, start, size) for query, start, size in requests]
+    with ThreadPoolExecutor(max_workers=min(len(requests), MAX_CONCURRENT_REQUESTS)) as executor:
+        return list(
+            executor.map(lambda request: _fetch_page(request[0], api_key, *request[1:]), requests)
+        )
+
 
-    with urllib.request.urlopen(url) as response:  # nosec B310 - URL from constant HTTPS endpoint
-        data = json.loads(response.read().decode("utf-8"))
+def _to_books(pages: list[tuple[dict[str, Any], ...]]) -> Iterator[Book]:
+    """Convert fetched pages of raw volume items to Book objects.
 
-    items = data.get("items", [])
+    The items may come from the _fetch_page cache, so every Book gets its own
+    copies of their lists and mutating a result cannot leak into later searches.
+    """
+    items = [item for page in pages for item in page]
     logger.info("Found %d books", len(items))
 
+    debug = logger.isEnabledFor(logging.DEBUG)
     for item in items:
         volume_info = item.get("volumeInfo", {})
 
-        # Extract ISBNs from industry identifiers
-        isbn_10 = None
-        isbn_13 = None
-        for identifier in volume_info.get("industryIdentifiers", []):
-            if identifier.get("type") == "ISBN_10":
-                isbn_10 = identifier.get("identifier")
-            elif identifier.get("type") == "ISBN_13":
-                isbn_13 = identifier.get("identifier")
+        # Map industry identifiers by type (ISBN_10, ISBN_13, ISSN, OTHER, ...)
+        identifiers = {
+            identifier["type"]: identifier.get("identifier")
+            for identifier in volume_info.get("industryIdentifiers", [])
+            if "type" in identifier
+        }
 
+        # Copy the lists: the raw items are shared by every hit of the _fetch_page cache
         book = Book(
             title=volume_info.get("title", "Unknown"),
-            authors=volume_info.get("authors", []),
+            authors=list(volume_info.get("authors", [])),
             publisher=volume_info.get("publisher"),
             published_date=volume_info.get("publishedDate"),
             description=volume_info.get("description"),
             page_count=volume_info.get("pageCount"),
-            categories=volume_info.get("categories", []),
+            categories=list(volume_info.get("categories", [])),
             preview_link=volume_info.get("previewLink"),
             info_link=volume_info.get("infoLink"),
-            isbn_10=isbn_10,
-            isbn_13=isbn_13,
+            isbn_10=identifiers.get("ISBN_10"),
+            isbn_13=identifiers.get("ISBN_13"),
         )
-        logger.debug("Found book: %s by %s", book.title, ", ".join(book.authors))
+        if debug:
+            logger.debug("Found book: %s by %s", book.title, ", ".join(book.authors))
         yield book
+
+
+def search_books(query: str, limit: int = 10) -> Iterator[Book]:
+    """Search Google Books for volumes.
+
+    The API returns at most 40 volumes per request, so larger limits are
+    split into pages (startIndex=0, 40, 80, ...) that are fetched concurrently.
+
+    Args:
+        query: Search query string
+        limit: Maximum number of results to return
+
+    Yields:
+        Book objects matching the query
+
+    Raises:
+        ValueError: If API key is not set
+        urllib3.exceptions.HTTPError: If network request fails
+
+    Example:
+        >>> for book in search_books("machine learning", limit=5):
+        ...     print(book.title)
+    """
+    api_key = get_api_key()
+
+    logger.info("Searching books: %s (limit=%d)", query, limit)
+    yield from _to_books(_fetch_pages(api_key, _page_requests(query, limit)))
+
+
+def search_books_many(queries: list[str], limit: int = 10) -> list[list[Book]]:
+    """Search Google Books for several queries concurrently.
+
+    All pages of all queries share one thread pool and the keep-alive
+    connection pool, so N queries take roughly one round-trip instead of N.
+
+    Args:
+        queries: Search query strings
+        limit: Maximum number of results to return per query
+
+    Returns:
+        One list of Book objects per query, in the order of the queries
+
+    Raises:
+        ValueError: If API key is not set
+        urllib3.exceptions.HTTPError: If any network request fails
+
+    Example:
+        >>> for books in search_books_many(["python", "rust"], limit=3):
+        ...     print([book.title for book in books])
+    """
+    api_key = get_api_key()
+
+    logger.info("Searching books for %d queries (limit=%d)", len(queries), limit)
+    per_query = [_page_requests(query, limit) for query in queries]
+    pages = _fetch_pages(api_key, [request for requests in per_query for request in requests])
+
+    results = []
+    offset = 0
+    for requests in per_query:
+        results.append(list(_to_books(pages[offset : offset + len(requests)])))
+        offset += len(requests)
+    return results
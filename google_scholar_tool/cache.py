@@ -0,0 +1,152 @@
+"""Result cache for Google Scholar queries.
+
+Scholar requests are slow, rate-limited and CAPTCHA-gated, so repeated queries
+are served from a two-tier cache: an in-process LRU (always on) backed by an
+optional SQLite file that survives across CLI invocations.
+
+The disk tier is enabled by setting GS_CACHE_DIR. Entries expire after
+GS_CACHE_TTL seconds (default 24 hours).
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from google_scholar_tool.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_TTL = 24 * 60 * 60
+DEFAULT_MAXSIZE = 1024
+# Part of every key; bump when the shape of cached values changes (e.g. a new
+# Publication or Author field) so rows written by an older version are misses
+CACHE_SCHEMA_VERSION = 1
+
+
+class ResultCache:
+    """Two-tier (memory + optional SQLite) cache of JSON-serializable values.
+
+    Both tiers hold the JSON encoding, so every get returns a fresh copy and
+    callers cannot mutate a cached value (or one they passed to set).
+    """
+
+    def __init__(
+        self, path: Path | None = None, ttl: float = DEFAULT_TTL, maxsize: int = DEFAULT_MAXSIZE
+    ) -> None:
+        """Create a cache.
+
+        Args:
+            path: SQLite database file for the persistent tier, or None for memory only
+            ttl: Seconds until an entry expires
+            maxsize: Maximum number of entries kept in memory
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            with self._db:
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS cache "
+                    "(key TEXT PRIMARY KEY, expires REAL NOT NULL, value TEXT NOT NULL)"
+                )
+                # Entries are only overwritten by the same key; drop expired ones so
+                # the file does not grow with every distinct query
+                self._db.execute("DELETE FROM cache WHERE expires <= ?", (time.time(),))
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for key, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    return json.loads(entry[1])
+                del self._memory[key]
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                "SELECT expires, value FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[0] <= now:
+                return None
+            self._remember(key, row[0], row[1])
+            return json.loads(row[1])
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value under key."""
+        expires = time.time() + self.ttl
+        encoded = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._remember(key, expires, encoded)
+            if self._db is not None:
+                with self._db:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO cache (key, expires, value) VALUES (?, ?, ?)",
+                        (key, expires, encoded),
+                    )
+
+    def clear(self) -> None:
+        """Remove all entries from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                with self._db:
+                    self._db.execute("DELETE FROM cache")
+
+    def _remember(self, key: str, expires: float, value: str) -> None:
+        """Insert into the memory tier, evicting the least recently used entry."""
+        self._memory[key] = (expires, value)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+
+def make_key(*parts: Any) -> str:
+    """Build a stable cache key from JSON-serializable parts."""
+    return json.dumps((CACHE_SCHEMA_VERSION, *parts), separators=(",", ":"), ensure_ascii=False)
+
+
+@lru_cache(maxsize=1)
+def get_cache() -> ResultCache:
+    """Return the process-wide result cache configured from the environment.
+
+    Returns:
+        ResultCache with a SQLite tier in GS_CACHE_DIR if set, else memory only.
+        If the SQLite file cannot be created or opened (unwritable directory,
+        corrupt database), a warning is logged and the cache is memory only.
+
+    Raises:
+        ValueError: If GS_CACHE_TTL is not a non-negative number of seconds
+    """
+    cache_dir = os.environ.get("GS_CACHE_DIR")
+    ttl_setting = os.environ.get("GS_CACHE_TTL", "")
+    try:
+        ttl = float(ttl_setting) if ttl_setting else DEFAULT_TTL
+        if not ttl >= 0:  # Also rejects nan
+            raise ValueError
+    except ValueError:
+        raise ValueError(
+            f"GS_CACHE_TTL must be a non-negative number of seconds, got {ttl_setting!r}"
+        ) from None
+    path = Path(cache_dir).expanduser() / "cache.sqlite3" if cache_dir else None
+    logger.debug("Result cache: %s (ttl=%ds)", path or "memory only", ttl)
+    if path is not None:
+        try:
+            return ResultCache(path, ttl)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Cannot use GS_CACHE_DIR cache %s (%s); caching in memory only", path, e)
+    return ResultCache(None, ttl)
@@ -8,32 +8,45 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
-import json
 import os
 import sys
 import warnings
+from collections.abc import Iterable, Iterator
+from itertools import chain
+from typing import TextIO
 
-# Suppress SyntaxWarnings from scholarly library before importing it
+# Suppress SyntaxWarnings from scholarly library before it is (lazily) imported
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="scholarly")
 
 import click  # noqa: E402
 
-from google_scholar_tool.books import Book, search_books  # noqa: E402
 from google_scholar_tool.completion import completion_command  # noqa: E402
 from google_scholar_tool.logging_config import get_logger, setup_logging  # noqa: E402
-from google_scholar_tool.scholar import (  # noqa: E402
-    Author,
-    Publication,
-    build_query,
-    get_author_details,
-    search_authors,
-    search_publications,
-)
+from google_scholar_tool.utils import json_dump_stream  # noqa: E402
+
+# The scholar (scholarly) and books (urllib3) modules are imported inside the
+# commands that use them, keeping --help, --version and completion fast.
 
 logger = get_logger(__name__)
 
 
-def hyperlink(url: str, text: str | None = None) -> str:
+def non_empty[T](items: Iterable[T]) -> Iterator[T] | None:
+    """Return an iterator over items, or None if there are none.
+
+    Only the first item is pulled, so search generators keep streaming.
+    """
+    iterator = iter(items)
+    for first in iterator:
+        return chain((first,), iterator)
+    return None
+
+
+def supports_hyperlinks() -> bool:
+    """Return whether stdout is a terminal that should receive escape sequences."""
+    return sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+
+
+def hyperlink(url: str, text: str | None = None, enabled: bool | None = None) -> str:
     """Create a clickable terminal hyperlink using OSC 8 escape sequence.
 
     Works in most modern terminals (iTerm2, Terminal.app, Windows Terminal, etc.).
@@ -41,13 +54,16 @@ def hyperlink(url: str, text: str | None = None) -> str:
     Args:
         url: The URL to link to
         text: Display text (defaults to URL if not provided)
+        enabled: Whether to emit escape sequences; detected from the terminal
+            when None. Commands pass the value computed once in main().
 
     Returns:
         Clickable hyperlink string or plain text if terminal doesn't support colors
     """
     display = text or url
-    # Check if terminal supports colors/escape sequences
-    if not sys.stdout.isatty() or os.environ.get("NO_COLOR"):
+    if enabled is None:
+        enabled = supports_hyperlinks()
+    if not enabled:
         return f"{display} ({url})" if text else url
     # OSC 8 hyperlink format: \033]8;;URL\033\\TEXT\033]8;;\033\\
     return f"\033]8;;{url}\033\\{display}\033]8;;\033\\"
@@ -87,6 +103,8 @@ def main(ctx: click.Context, verbose: int, quiet: bool) -> None:
     ctx.ensure_object(dict)
     ctx.obj["verbose"] = verbose
     ctx.obj["quiet"] = quiet
+    # Check terminal capabilities once instead of per hyperlink
+    ctx.obj["hyperlinks"] = supports_hyperlinks()
 
     # Setup logging based on verbosity count
     if quiet:
@@ -166,6 +184,8 @@ def search_cmd(
         [{"title": "...", "authors": [...], "year": "2024",
           "abstract": "...", "citations": 100, "url": "..."}]
     """
+    from google_scholar_tool.scholar import Publication, build_query, search_publications
+
     quiet = ctx.obj.get("quiet", False)
 
     # Handle stdin input
@@ -201,40 +221,46 @@ def search_cmd(
 
     # Execute search
     logger.info("Executing search: %s", final_query)
-    results: list[Publication] = list(
-        search_publications(
-            final_query,
-            limit=limit,
-            year_start=year_start,
-            year_end=year_end,
-            sort_by=sort,
+    try:
+        results: Iterator[Publication] | None = non_empty(
+            search_publications(
+                final_query,
+                limit=limit,
+                year_start=year_start,
+                year_end=year_end,
+                sort_by=sort,
+            )
         )
-    )
+    except ValueError as e:
+        click.echo(f"Error: {e}", err=True)
+        ctx.exit(1)
 
-    if not results:
+    if results is None:
         if not quiet:
             click.echo("No results found")
         return
 
     # Output results
     if json_output:
-        output = [pub.to_dict() for pub in results]
-        click.echo(json.dumps(output, indent=2, ensure_ascii=False))
-    else:
+        json_dump_stream(results, sys.stdout)
+    elif not quiet:
+        # Collect all lines and write them in a single echo
+        links = ctx.obj.get("hyperlinks", False)
+        lines: list[str] = []
         for i, pub in enumerate(results, 1):
-            if not quiet:
-                # Title with clickable link if pub_url available
-                if pub.pub_url:
-                    title_display = hyperlink(pub.pub_url, pub.title)
-                else:
-                    title_display = pub.title
-                click.echo(f"\n{i}. {title_display}")
-                click.echo(f"   Authors: {', '.join(pub.authors) if pub.authors else 'Unknown'}")
-                click.echo(f"   Year: {pub.year or 'Unknown'}")
-                click.echo(f"   Citations: {pub.citations}")
-                if pub.url:
-                    # PDF/eprint link
-                    click.echo(f"   PDF: {hyperlink(pub.url, '[Download]')}")
+            # Title with clickable link if pub_url available
+            if pub.pub_url:
+                title_display = hyperlink(pub.pub_url, pub.title, links)
+            else:
+                title_display = pub.title
+            lines.append(f"\n{i}. {title_display}")
+            lines.append(f"   Authors: {', '.join(pub.authors) if pub.authors else 'Unknown'}")
+            lines.append(f"   Year: {pub.year or 'Unknown'}")
+            lines.append(f"   Citations: {pub.citations}")
+            if pub.url:
+                # PDF/eprint link
+                lines.append(f"   PDF: {hyperlink(pub.url, '[Download]', links)}")
+        click.echo("\n".join(lines))
 
 
 @main.command("author")
@@ -276,6 +302,8 @@ def author_cmd(
         [{"name": "...", "affiliation": "...", "citations": 1000,
           "h_index": 50, "i10_index": 100, "interests": [...]}]
     """
+    from google_scholar_tool.scholar import Author, get_author_details, search_authors
+
     quiet = ctx.obj.get("quiet", False)
 
     # Handle stdin input
@@ -293,41 +321,46 @@ def author_cmd(
         click.echo("Fix: author 'name' OR author --scholar-id 'ID'", err=True)
         ctx.exit(1)
 
-    # Get author by ID
-    if scholar_id:
-        logger.info("Getting author by ID: %s", scholar_id)
-        author = get_author_details(scholar_id)
-        if not author:
-            click.echo("Author not found", err=True)
-            ctx.exit(1)
-        results: list[Author] = [author]
-    else:
-        # Search by name
-        logger.info("Searching for author: %s", query)
-        results = list(search_authors(query or "", limit=limit))
+    try:
+        # Get author by ID
+        if scholar_id:
+            logger.info("Getting author by ID: %s", scholar_id)
+            author = get_author_details(scholar_id)
+            if not author:
+                click.echo("Author not found", err=True)
+                ctx.exit(1)
+            results: Iterator[Author] | None = iter([author])
+        else:
+            # Search by name
+            logger.info("Searching for author: %s", query)
+            results = non_empty(search_authors(query or "", limit=limit))
+    except ValueError as e:
+        click.echo(f"Error: {e}", err=True)
+        ctx.exit(1)
 
-    if not results:
+    if results is None:
         if not quiet:
             click.echo("No authors found")
         return
 
     # Output results
     if json_output:
-        output = [author.to_dict() for author in results]
-        click.echo(json.dumps(output, indent=2, ensure_ascii=False))
-    else:
+        json_dump_stream(results, sys.stdout)
+    elif not quiet:
+        # Collect all lines and write them in a single echo
+        lines: list[str] = []
         for i, author in enumerate(results, 1):
-            if not quiet:
-                click.echo(f"\n{i}. {author.name}")
-                if author.affiliation:
-                    click.echo(f"   Affiliation: {author.affiliation}")
-                click.echo(f"   Citations: {author.citations}")
-                click.echo(f"   h-index: {author.h_index}")
-                click.echo(f"   i10-index: {author.i10_index}")
-                if author.interests:
-                    click.echo(f"   Interests: {', '.join(author.interests)}")
-                if author.scholar_id:
-                    click.echo(f"   Scholar ID: {author.scholar_id}")
+            lines.append(f"\n{i}. {author.name}")
+            if author.affiliation:
+                lines.append(f"   Affiliation: {author.affiliation}")
+            lines.append(f"   Citations: {author.citations}")
+            lines.append(f"   h-index: {author.h_index}")
+            lines.append(f"   i10-index: {author.i10_index}")
+            if author.interests:
+                lines.append(f"   Interests: {', '.join(author.interests)}")
+            if author.scholar_id:
+                lines.append(f"   Scholar ID: {author.scholar_id}")
+        click.echo("\n".join(lines))
 
 
 @main.command("books")
@@ -341,6 +374,12 @@ def author_cmd(
     type=click.Choice(["apa", "mla", "chicago", "harvard"], case_sensitive=False),
     help="Output citations in specified style",
 )
+@click.option(
+    "-b",
+    "--batch-file",
+    type=click.File("r"),
+    help="File with one query per line, searched concurrently",
+)
 @click.pass_context
 def books_cmd(
     ctx: click.Context,
@@ -349,6 +388,7 @@ def books_cmd(
     json_output: bool,
     stdin: bool,
     cite: str | None,
+    batch_file: TextIO | None,
 ) -> None:
     """Search Google Books for volumes.
 
@@ -372,6 +412,10 @@ def books_cmd(
         # Get MLA citations
         google-scholar-tool books "machine learning" --cite mla --limit 5
 
+    \b
+        # Cite the results of many queries at once (one query per line)
+        google-scholar-tool books --batch-file queries.txt --cite apa --limit 1
+
     \b
     Note: Content search within books is not available via the API.
     Use --preview-link in output to search manually in Google Books.
@@ -380,7 +424,14 @@ def books_cmd(
     Output Format (JSON):
         [{"title": "...", "authors": [...], "publisher": "...",
           "published_date": "2024", "description": "...", "page_count": 300}]
+
+    \b
+    With --batch-file, results are always grouped per query:
+        [{"query": "...", "results": [{"title": "...", ...}]}]
+    Text output gets a header per query; --cite prints one flat list.
     """
+    from google_scholar_tool.books import Book, search_books, search_books_many
+
     quiet = ctx.obj.get("quiet", False)
 
     # Handle stdin input
@@ -392,8 +443,13 @@ def books_cmd(
             click.echo("Fix: echo 'query' | google-scholar-tool books --stdin", err=True)
             ctx.exit(1)
 
+    # Collect queries: the QUERY argument and/or one query per batch file line
+    queries = [query] if query else []
+    if batch_file:
+        queries.extend(line.strip() for line in batch_file if line.strip())
+
     # Validate query
-    if not query:
+    if not queries:
         click.echo("Error: Missing query argument", err=True)
         click.echo(
             "Fix: Provide a search query, e.g.: google-scholar-tool books 'python'",
@@ -402,48 +458,76 @@ def books_cmd(
         ctx.exit(1)
 
     # Execute search
-    logger.info("Executing books search: %s", query)
+    logger.info("Executing books search: %s", ", ".join(queries))
     try:
-        results: list[Book] = list(search_books(query, limit=limit))
+        if batch_file is None:
+            results: Iterator[Book] | None = non_empty(search_books(queries[0], limit=limit))
+            groups = None
+        else:
+            # Batch mode always groups results per query (even for a one-line file), so
+            # the output shape does not depend on how many queries the file holds
+            groups = list(zip(queries, search_books_many(queries, limit=limit), strict=True))
+            results = non_empty(chain.from_iterable(books for _, books in groups))
     except ValueError as e:
         click.echo(f"Error: {e}", err=True)
         ctx.exit(1)
 
-    if not results:
+    if results is None:
         if not quiet:
             click.echo("No results found")
         return
 
+    links = ctx.obj.get("hyperlinks", False)
+
+    def book_lines(i: int, book: Book) -> list[str]:
+        """Format one numbered book for human-readable output."""
+        # Title with clickable link if info_link available
+        if book.info_link:
+            title_display = hyperlink(book.info_link, book.title, links)
+        else:
+            title_display = book.title
+        lines = [
+            f"\n{i}. {title_display}",
+            f"   Authors: {', '.join(book.authors) if book.authors else 'Unknown'}",
+        ]
+        if book.publisher:
+            lines.append(f"   Publisher: {book.publisher}")
+        if book.published_date:
+            lines.append(f"   Published: {book.published_date}")
+        if book.page_count:
+            lines.append(f"   Pages: {book.page_count}")
+        if book.categories:
+            lines.append(f"   Categories: {', '.join(book.categories)}")
+        if book.isbn:
+            lines.append(f"   ISBN: {book.isbn}")
+        if book.preview_link:
+            preview = hyperlink(book.preview_link, "[Search in book]", links)
+            lines.append(f"   Preview: {preview}")
+        return lines
+
     # Output results
     if json_output:
-        output = [book.to_dict() for book in results]
-        click.echo(json.dumps(output, indent=2, ensure_ascii=False))
+        if groups is None:
+            json_dump_stream(results, sys.stdout)
+        else:
+            json_dump_stream(({"query": q, "results": books} for q, books in groups), sys.stdout)
     elif cite:
-        # Citation output mode
-        for book in results:
-            click.echo(book.cite(cite))
-    else:
-        for i, book in enumerate(results, 1):
-            if not quiet:
-                # Title with clickable link if info_link available
-                if book.info_link:
-                    title_display = hyperlink(book.info_link, book.title)
-                else:
-                    title_display = book.title
-                click.echo(f"\n{i}. {title_display}")
-                click.echo(f"   Authors: {', '.join(book.authors) if book.authors else 'Unknown'}")
-                if book.publisher:
-                    click.echo(f"   Publisher: {book.publisher}")
-                if book.published_date:
-                    click.echo(f"   Published: {book.published_date}")
-                if book.page_count:
-                    click.echo(f"   Pages: {book.page_count}")
-                if book.categories:
-                    click.echo(f"   Categories: {', '.join(book.categories)}")
-                if book.isbn:
-                    click.echo(f"   ISBN: {book.isbn}")
-                if book.preview_link:
-                    click.echo(f"   Preview: {hyperlink(book.preview_link, '[Search in book]')}")
+        # Citation output mode: one flat bibliography, also for batch searches
+        click.echo("\n".join(book.cite(cite) for book in results))
+    elif not quiet:
+        # Collect all lines and write them in a single echo
+        lines: list[str] = []
+        if groups is None:
+            for i, book in enumerate(results, 1):
+                lines.extend(book_lines(i, book))
+        else:
+            for q, books in groups:
+                lines.append(f"\n=== {q} ===")
+                if not books:
+                    lines.append("No results found")
+                for i, book in enumerate(books, 1):
+                    lines.extend(book_lines(i, book))
+        click.echo("\n".join(lines))
 
 
 # Add completion subcommand
@@ -7,9 +7,16 @@ and has been reviewed and tested by a human.
 import click
 from click.shell_completion import BashComplete, FishComplete, ShellComplete, ZshComplete
 
+# Completion class per supported shell
+_COMPLETION_CLASSES: dict[str, type[ShellComplete]] = {
+    "bash": BashComplete,
+    "zsh": ZshComplete,
+    "fish": FishComplete,
+}
+
 
 @click.command(name="completion")
-@click.argument("shell", type=click.Choice(["bash", "zsh", "fish"], case_sensitive=False))
+@click.argument("shell", type=click.Choice(list(_COMPLETION_CLASSES), case_sensitive=False))
 def completion_command(shell: str) -> None:
     """Generate shell completion script.
 
@@ -59,13 +66,7 @@ def completion_command(shell: str) -> None:
     ctx = click.get_current_context()
 
     # Get the appropriate completion class
-    completion_classes: dict[str, type[ShellComplete]] = {
-        "bash": BashComplete,
-        "zsh": ZshComplete,
-        "fish": FishComplete,
-    }
-
-    completion_class = completion_classes.get(shell.lower())
+    completion_class = _COMPLETION_CLASSES.get(shell.lower())
     if completion_class:
         completer = completion_class(
             cli=ctx.find_root().command,
@@ -0,0 +1,62 @@
+"""JSON-over-HTTP helper shared by the Google Books and SerpApi clients.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import json
+import logging
+from typing import Any
+
+import urllib3
+
+from google_scholar_tool.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Fail a stalled request instead of hanging the CLI; both APIs answer within seconds
+REQUEST_TIMEOUT = urllib3.Timeout(connect=5.0, read=15.0)
+
+
+def get_json(pool: urllib3.PoolManager, url: str, service: str, api_key: str) -> Any:
+    """GET a URL through a connection pool and decode its JSON body.
+
+    Args:
+        pool: Keep-alive connection pool to send the request through
+        url: Full request URL, including the API key
+        service: Service name used in error messages, e.g. "SerpApi"
+        api_key: API key to redact from the debug log
+
+    Returns:
+        The decoded JSON body
+
+    Raises:
+        urllib3.exceptions.HTTPError: If the response status is not 200
+    """
+    # Guarded: the redaction runs before logger.debug could discard the record
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Request URL: %s", url.replace(api_key, "***"))
+
+    # urllib3 decompresses gzip bodies transparently
+    response = pool.request("GET", url, timeout=REQUEST_TIMEOUT)
+    if response.status != 200:
+        raise urllib3.exceptions.HTTPError(
+            f"{service} request failed with HTTP {response.status}" + _error_detail(response.data)
+        )
+
+    # json.loads parses the UTF-8 body bytes directly; no intermediate str copy
+    return json.loads(response.data)
+
+
+def _error_detail(body: bytes) -> str:
+    """Return ": <message>" from a JSON error body, or "" if it has none.
+
+    Google APIs send {"error": {"message": ...}}; SerpApi sends {"error": ...}.
+    """
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return ""
+    error = data.get("error") if isinstance(data, dict) else None
+    message = error.get("message") if isinstance(error, dict) else error
+    return f": {message}" if isinstance(message, str) and message else ""
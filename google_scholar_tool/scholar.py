@@ -8,18 +8,101 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
-import json
-from collections.abc import Iterator
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-
-from scholarly import scholarly  # type: ignore[import-untyped]
-
+from itertools import islice
+from typing import Any, Self, TypedDict, cast
+
+# scholarly keeps one long-lived httpx.Client per proxy generator and reuses it
+# for every page fetch, so successive requests already share keep-alive TCP/TLS
+# connections; no session needs to be injected here.
+from scholarly import (  # type: ignore[import-untyped]
+    DOSException,
+    MaxTriesExceededException,
+    scholarly,
+)
+
+from google_scholar_tool.cache import get_cache, make_key
 from google_scholar_tool.logging_config import get_logger
+from google_scholar_tool.scholar_backends import get_backend
+from google_scholar_tool.utils import json_dumps
 
 logger = get_logger(__name__)
 
 
-@dataclass
+def _enable_fast_parser() -> bool:
+    """Make scholarly parse result pages with lxml instead of html.parser.
+
+    scholarly builds every page's BeautifulSoup with the pure-Python
+    html.parser. lxml produces the same tree from a C parser, which is several
+    times faster per page. Enabled by setting GS_FAST_PARSER=1.
+
+    Returns:
+        True if the lxml parser was installed, False if lxml is unavailable
+    """
+    try:
+        import lxml  # type: ignore[import-untyped]  # noqa: F401
+        from scholarly import _navigator
+    except ImportError:
+        logger.warning("GS_FAST_PARSER is set but lxml is not installed; using html.parser")
+        return False
+
+    beautiful_soup = _navigator.BeautifulSoup
+
+    def lxml_soup(markup: str, features: str | None = None, **kwargs: Any) -> Any:
+        return beautiful_soup(markup, "lxml", **kwargs)
+
+    _navigator.BeautifulSoup = lxml_soup
+    logger.debug("Using lxml parser for Google Scholar pages")
+    return True
+
+
+if os.environ.get("GS_FAST_PARSER") == "1":
+    _enable_fast_parser()
+
+# Concurrent Scholar queries for *_many functions (override with GS_MAX_CONCURRENCY).
+# Kept low: Google Scholar rate-limits aggressively.
+DEFAULT_MAX_CONCURRENCY = 2
+DEFAULT_AUTHOR_SECTIONS = ("basics", "indices")
+
+# Attempts for rate-limited Scholar lookups (override with GS_MAX_RETRIES)
+DEFAULT_MAX_RETRIES = 3
+MAX_BACKOFF_SECONDS = 30
+
+
+class PublicationDict(TypedDict):
+    """Serialized form of a Publication (see Publication.to_dict)."""
+
+    title: str
+    authors: list[str]
+    year: str | None
+    abstract: str | None
+    citations: int
+    url: str | None
+    pub_url: str | None
+
+
+class AuthorDict(TypedDict):
+    """Serialized form of an Author (see Author.to_dict)."""
+
+    name: str
+    affiliation: str | None
+    email_domain: str | None
+    citations: int
+    h_index: int
+    i10_index: int
+    interests: list[str]
+    scholar_id: str | None
+
+
+@dataclass(slots=True)
 class Publication:
     """Represents a Google Scholar publication."""
 
@@ -31,7 +114,23 @@ class Publication:
     url: str | None
     pub_url: str | None
 
-    def to_dict(self) -> dict[str, str | int | list[str] | None]:
+    @classmethod
+    def from_search_result(cls, result: dict[str, Any]) -> Self:
+        """Create a publication from a scholarly search_pubs result."""
+        # Bound lookups: this runs once per result
+        r_get = result.get
+        b_get = (r_get("bib") or {}).get
+        return cls(
+            title=b_get("title", "Unknown"),
+            authors=b_get("author") or [],
+            year=b_get("pub_year"),
+            abstract=b_get("abstract"),
+            citations=r_get("num_citations", 0),
+            url=r_get("eprint_url"),
+            pub_url=r_get("pub_url"),
+        )
+
+    def to_dict(self) -> PublicationDict:
         """Convert publication to dictionary."""
         return {
             "title": self.title,
@@ -45,10 +144,10 @@ class Publication:
 
     def to_json(self) -> str:
         """Convert publication to JSON string."""
-        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        return json_dumps(self.to_dict())
 
 
-@dataclass
+@dataclass(slots=True)
 class Author:
     """Represents a Google Scholar author."""
 
@@ -61,7 +160,22 @@ class Author:
     interests: list[str]
     scholar_id: str | None
 
-    def to_dict(self) -> dict[str, str | int | list[str] | None]:
+    @classmethod
+    def from_search_result(cls, result: dict[str, Any]) -> Self:
+        """Create an author from a scholarly author result (searched or filled)."""
+        r_get = result.get
+        return cls(
+            name=r_get("name", "Unknown"),
+            affiliation=r_get("affiliation"),
+            email_domain=r_get("email_domain"),
+            citations=r_get("citedby", 0),
+            h_index=r_get("hindex", 0),
+            i10_index=r_get("i10index", 0),
+            interests=r_get("interests") or [],
+            scholar_id=r_get("scholar_id"),
+        )
+
+    def to_dict(self) -> AuthorDict:
         """Convert author to dictionary."""
         return {
             "name": self.name,
@@ -76,7 +190,7 @@ class Author:
 
     def to_json(self) -> str:
         """Convert author to JSON string."""
-        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        return json_dumps(self.to_dict())
 
 
 def build_query(
@@ -104,98 +218,275 @@ def build_query(
         ... )
         '(HRM OR "human resource management") AND "job satisfaction" intitle:"the Netherlands"'
     """
-    query_parts = []
-
-    # Handle main terms with OR
+    # Main terms (combined with OR) and exact phrases are joined with AND
+    clauses: list[str] = []
     if terms:
-        if len(terms) == 1:
-            query_parts.append(terms[0])
-        else:
-            # Combine with OR
-            or_terms = " OR ".join(terms)
-            query_parts.append(f"({or_terms})")
-
-    # Handle exact phrases
+        clauses.append(terms[0] if len(terms) == 1 else "(" + " OR ".join(terms) + ")")
     if exact_phrases:
-        for phrase in exact_phrases:
-            if " " in phrase:
-                query_parts.append(f'"{phrase}"')
-            else:
-                query_parts.append(phrase)
-
-    # Combine with AND
-    query = " AND ".join(query_parts) if len(query_parts) > 1 else "".join(query_parts)
+        clauses.extend('"' + phrase + '"' if " " in phrase else phrase for phrase in exact_phrases)
 
-    # Add intitle constraint
+    # Title constraint and exclusions are appended without operators
+    parts = [" AND ".join(clauses)]
     if intitle:
-        query += f' intitle:"{intitle}"'
-
-    # Add exclusions
+        parts += (' intitle:"', intitle, '"')
     if exclude_terms:
-        for term in exclude_terms:
-            query += f" -{term}"
+        parts += (" -", " -".join(exclude_terms))
+    query = "".join(parts)
 
     logger.debug("Built query: %s", query)
     return query
 
 
+_DONE = object()  # Sentinel marking the end of a prefetched iterator
+
+
+def _prefetch_iter[T](iterable: Iterable[T], ahead: int = 1) -> Iterator[T]:
+    """Iterate in a background thread, keeping up to `ahead` items ready.
+
+    scholarly fetches a new result page whenever its iterator runs dry. Pulling
+    items on a worker thread overlaps that network wait with the caller's work
+    on the current item. Exceptions from the iterable are re-raised in the
+    caller; closing the generator stops the worker.
+
+    Args:
+        iterable: Source iterable (bound it, e.g. with islice, to avoid over-fetching)
+        ahead: Number of items to buffer; 0 disables prefetching
+
+    Yields:
+        Items from iterable in order
+    """
+    if ahead <= 0:
+        yield from iterable
+        return
+
+    # Entries are (item, None), or (_DONE, error or None) once the iterable ends
+    buffer: queue.Queue[tuple[T | object, BaseException | None]] = queue.Queue(maxsize=ahead)
+    stop = threading.Event()
+
+    def put(entry: tuple[T | object, BaseException | None]) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def worker() -> None:
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except Exception as e:
+            put((_DONE, e))
+            return
+        put((_DONE, None))
+
+    threading.Thread(target=worker, name="scholar-prefetch", daemon=True).start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if error is not None:
+                raise error
+            if item is _DONE:
+                return
+            yield cast(T, item)
+    finally:
+        stop.set()
+
+
+def _positive_int_env(name: str, default: int) -> int:
+    """Return a positive integer setting from the environment.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset or empty
+
+    Raises:
+        ValueError: If the variable is not a positive integer
+    """
+    setting = os.environ.get(name, "")
+    try:
+        value = int(setting) if setting else default
+        if value < 1:
+            raise ValueError
+    except ValueError:
+        raise ValueError(f"{name} must be a positive integer, got {setting!r}") from None
+    return value
+
+
+def _max_retries() -> int:
+    """Return the attempt budget from GS_MAX_RETRIES.
+
+    Raises:
+        ValueError: If GS_MAX_RETRIES is not a positive integer
+    """
+    return _positive_int_env("GS_MAX_RETRIES", DEFAULT_MAX_RETRIES)
+
+
+def _max_concurrency() -> int:
+    """Return the number of queries to run at once from GS_MAX_CONCURRENCY.
+
+    Raises:
+        ValueError: If GS_MAX_CONCURRENCY is not a positive integer
+    """
+    return _positive_int_env("GS_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)
+
+
+def _call_with_retries[T](call: Callable[[], T], attempts: int) -> T:
+    """Run a Scholar request, backing off and retrying when rate-limited.
+
+    scholarly raises MaxTriesExceededException or DOSException once Google
+    Scholar starts answering with CAPTCHAs or 429s. Those usually clear after a
+    short pause, so the call is retried with jittered exponential backoff.
+    Other exceptions, and the last rate-limit error, propagate to the caller.
+
+    Args:
+        call: Zero-argument function performing the request
+        attempts: Total number of tries, including the first (see _max_retries)
+
+    Returns:
+        The result of call
+    """
+    for attempt in range(attempts - 1):
+        try:
+            return call()
+        except (MaxTriesExceededException, DOSException) as e:
+            delay = min(MAX_BACKOFF_SECONDS, 2**attempt) + random.uniform(0, 1)  # nosec B311
+            logger.debug("Rate-limited by Google Scholar (%s), retrying in %.1fs", e, delay)
+            time.sleep(delay)
+    return call()
+
+
 def search_publications(
     query: str,
     limit: int = 10,
     year_start: int | None = None,
     year_end: int | None = None,
     sort_by: str = "relevance",
+    cache_bypass: bool = False,
+    prefetch: int = 1,
 ) -> Iterator[Publication]:
     """Search Google Scholar for publications.
 
+    Results come from the backend selected by GS_BACKEND (see
+    google_scholar_tool.scholar_backends). They are cached (see
+    google_scholar_tool.cache) once the search has been consumed up to the
+    limit, so repeating a query skips the network.
+
     Args:
         query: Search query string (supports Boolean operators)
         limit: Maximum number of results to return
         year_start: Filter results from this year onwards
         year_end: Filter results up to this year
         sort_by: Sort order - 'relevance' or 'date' (newest first)
+        cache_bypass: Neither read from nor write to the result cache
+        prefetch: Results to fetch ahead in the background while the caller
+            consumes the current one (0 disables)
 
     Yields:
         Publication objects matching the query
 
+    Raises:
+        ValueError: If the GS_BACKEND configuration is invalid
+
     Example:
         >>> for pub in search_publications('"machine learning" AND healthcare', limit=5):
         ...     print(pub.title)
     """
     logger.info("Searching publications: %s (limit=%d, sort=%s)", query, limit, sort_by)
 
-    search_query = scholarly.search_pubs(
-        query, year_low=year_start, year_high=year_end, sort_by=sort_by
-    )
-
-    count = 0
-    for result in search_query:
-        if count >= limit:
-            break
-
-        bib = result.get("bib", {})
-        pub = Publication(
-            title=bib.get("title", "Unknown"),
-            authors=bib.get("author", []),
-            year=bib.get("pub_year"),
-            abstract=bib.get("abstract"),
-            citations=result.get("num_citations", 0),
-            url=result.get("eprint_url"),
-            pub_url=result.get("pub_url"),
-        )
-        logger.debug("Found publication: %s (%s)", pub.title, pub.year)
+    backend = get_backend()
+    cache = get_cache()
+    cache_key = make_key("publications", backend.name, query, limit, year_start, year_end, sort_by)
+    if not cache_bypass:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.info("Found %d publications (cached)", len(cached))
+            for data in cached:
+                yield Publication(**data)
+            return
+
+    search_query = backend.iter_pubs(query, year_start, year_end, sort_by)
+
+    found: list[PublicationDict] = []
+    debug = logger.isEnabledFor(logging.DEBUG)
+    for result in _prefetch_iter(islice(search_query, limit), ahead=prefetch):
+        pub = Publication.from_search_result(result)
+        if debug:
+            logger.debug("Found publication: %s (%s)", pub.title, pub.year)
+        found.append(pub.to_dict())
         yield pub
-        count += 1
 
-    logger.info("Found %d publications", count)
+    logger.info("Found %d publications", len(found))
+    if not cache_bypass:
+        cache.set(cache_key, found)
+
+
+def search_publications_many(
+    queries: list[str],
+    limit: int = 10,
+    year_start: int | None = None,
+    year_end: int | None = None,
+    sort_by: str = "relevance",
+    cache_bypass: bool = False,
+) -> list[list[Publication]]:
+    """Search Google Scholar for several queries concurrently.
+
+    With a thread-safe backend (GS_BACKEND=serpapi), up to GS_MAX_CONCURRENCY
+    queries (default 2) run at the same time, so N independent queries take
+    roughly N / concurrency round-trips instead of N. scholarly drives one
+    process-wide navigator (shared HTTP session, 403 and CAPTCHA state), so
+    with the default backend the queries run one after another.
+
+    Args:
+        queries: Search query strings (support Boolean operators)
+        limit: Maximum number of results to return per query
+        year_start: Filter results from this year onwards
+        year_end: Filter results up to this year
+        sort_by: Sort order - 'relevance' or 'date' (newest first)
+        cache_bypass: Neither read from nor write to the result cache
+
+    Returns:
+        One list of Publication objects per query, in the order of the queries
+
+    Raises:
+        ValueError: If GS_MAX_CONCURRENCY or the GS_BACKEND configuration is invalid
+
+    Example:
+        >>> for pubs in search_publications_many(["HRM", "job satisfaction"], limit=3):
+        ...     print([pub.title for pub in pubs])
+    """
+    if not queries:
+        return []
+    concurrency = _max_concurrency()
+    max_workers = min(len(queries), concurrency) if get_backend().thread_safe else 1
+    logger.info("Searching publications for %d queries (concurrency=%d)", len(queries), max_workers)
+
+    def run(query: str) -> list[Publication]:
+        # Queries already overlap each other; no per-query prefetch thread needed
+        return list(
+            search_publications(
+                query, limit, year_start, year_end, sort_by, cache_bypass, prefetch=0
+            )
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run, queries))
 
 
-def search_authors(query: str, limit: int = 10) -> Iterator[Author]:
+def search_authors(
+    query: str, limit: int = 10, cache_bypass: bool = False, prefetch: int = 1
+) -> Iterator[Author]:
     """Search Google Scholar for authors.
 
+    Results are cached once the search has been consumed up to the limit.
+
     Args:
         query: Author name or keywords to search
         limit: Maximum number of results to return
+        cache_bypass: Neither read from nor write to the result cache
+        prefetch: Results to fetch ahead in the background (0 disables)
 
     Yields:
         Author objects matching the query
@@ -206,60 +497,87 @@ def search_authors(query: str, limit: int = 10) -> Iterator[Author]:
     """
     logger.info("Searching authors: %s (limit=%d)", query, limit)
 
+    cache = get_cache()
+    cache_key = make_key("authors", query, limit)
+    if not cache_bypass:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.info("Found %d authors (cached)", len(cached))
+            for data in cached:
+                yield Author(**data)
+            return
+
     search_query = scholarly.search_author(query)
 
-    count = 0
-    for result in search_query:
-        if count >= limit:
-            break
-
-        author = Author(
-            name=result.get("name", "Unknown"),
-            affiliation=result.get("affiliation"),
-            email_domain=result.get("email_domain"),
-            citations=result.get("citedby", 0),
-            h_index=result.get("hindex", 0),
-            i10_index=result.get("i10index", 0),
-            interests=result.get("interests", []),
-            scholar_id=result.get("scholar_id"),
-        )
-        logger.debug("Found author: %s (h-index=%d)", author.name, author.h_index)
+    found: list[AuthorDict] = []
+    debug = logger.isEnabledFor(logging.DEBUG)
+    for result in _prefetch_iter(islice(search_query, limit), ahead=prefetch):
+        author = Author.from_search_result(result)
+        if debug:
+            logger.debug("Found author: %s (h-index=%d)", author.name, author.h_index)
+        found.append(author.to_dict())
         yield author
-        count += 1
 
-    logger.info("Found %d authors", count)
+    logger.info("Found %d authors", len(found))
+    if not cache_bypass:
+        cache.set(cache_key, found)
 
 
-def get_author_details(scholar_id: str) -> Author | None:
+def get_author_details(
+    scholar_id: str,
+    sections: tuple[str, ...] = DEFAULT_AUTHOR_SECTIONS,
+    cache_bypass: bool = False,
+) -> Author | None:
     """Get detailed information about an author by their Scholar ID.
 
+    Rate-limited lookups are retried (see _call_with_retries). Only the
+    requested profile sections are filled. The defaults cover every
+    Author field; 'publications' and 'coauthors' cost extra requests (one per
+    page of publications) and are not needed for the summary. Found authors
+    are cached; failed lookups are not.
+
     Args:
         scholar_id: Google Scholar author ID
+        sections: scholarly profile sections to fill ('basics', 'indices',
+            'counts', 'coauthors', 'publications', 'public_access'); an
+            empty tuple skips filling and returns the profile summary only
+        cache_bypass: Neither read from nor write to the result cache
 
     Returns:
         Author object with full details, or None if not found
 
+    Raises:
+        ValueError: If GS_MAX_RETRIES or GS_CACHE_TTL is invalid
+
     Example:
         >>> author = get_author_details("XrH4VJUAAAAJ")
         >>> print(author.name, author.citations)
     """
     logger.info("Getting author details for ID: %s", scholar_id)
 
-    try:
+    # Configuration errors must not be mistaken for a missing author below
+    attempts = _max_retries()
+
+    cache = get_cache()
+    cache_key = make_key("author", scholar_id, sections)
+    if not cache_bypass:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.info("Found author details for ID: %s (cached)", scholar_id)
+            return Author(**cached)
+
+    def lookup() -> Any:
         result = scholarly.search_author_id(scholar_id)
-        result = scholarly.fill(result)
-
-        author = Author(
-            name=result.get("name", "Unknown"),
-            affiliation=result.get("affiliation"),
-            email_domain=result.get("email_domain"),
-            citations=result.get("citedby", 0),
-            h_index=result.get("hindex", 0),
-            i10_index=result.get("i10index", 0),
-            interests=result.get("interests", []),
-            scholar_id=result.get("scholar_id"),
-        )
-        return author
+        if sections:
+            result = scholarly.fill(result, sections=list(sections))
+        return result
+
+    try:
+        author = Author.from_search_result(_call_with_retries(lookup, attempts))
     except Exception as e:
         logger.error("Failed to get author details: %s", e)
         return None
+
+    if not cache_bypass:
+        cache.set(cache_key, author.to_dict())
+    return author
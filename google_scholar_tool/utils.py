@@ -4,6 +4,15 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
+import json
+from collections.abc import Iterable
+from typing import Any, TextIO
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
 
 def get_greeting() -> str:
     """Return a greeting message.
@@ -12,3 +21,65 @@ def get_greeting() -> str:
         str: The greeting message "Hello World"
     """
     return "Hello World"
+
+
+def _to_serializable(obj: Any) -> Any:
+    """Convert result objects (Book, Publication, Author) via their to_dict()."""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+# json.dumps builds a new encoder on every call once options are passed; reuse one
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, default=_to_serializable)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize an object to an indented JSON string.
+
+    Uses orjson when it is installed and falls back to the standard library
+    json module otherwise. Both produce the same output: two-space indentation
+    with non-ASCII characters left unescaped.
+
+    Result dataclasses can be passed directly, without building an intermediate
+    list of dicts: orjson serializes dataclass fields natively (skipping private
+    fields), and the json fallback calls each object's to_dict().
+
+    Args:
+        obj: JSON-serializable object, possibly containing result dataclasses
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_to_serializable, option=orjson.OPT_INDENT_2).decode()
+    return _JSON_ENCODER.encode(obj)
+
+
+def json_dump_stream(items: Iterable[Any], fp: TextIO) -> int:
+    """Write items to fp as an indented JSON array, one record at a time.
+
+    The output is identical to json_dumps(list(items)) plus a trailing newline,
+    but records are encoded and written as they arrive, so a search generator
+    can be streamed without holding every result in memory. If items raises
+    partway through, the records written so far are closed into a valid array
+    before the exception propagates.
+
+    Args:
+        items: JSON-serializable objects, possibly result dataclasses
+        fp: Text stream to write to
+
+    Returns:
+        Number of records written
+    """
+    count = 0
+    try:
+        for item in items:
+            # Strings in JSON never contain raw newlines, so indenting is a plain replace
+            fp.write(("[\n  " if count == 0 else ",\n  ") + json_dumps(item).replace("\n", "\n  "))
+            count += 1
+    finally:
+        # Close the array even when items fails midway, so fp never holds truncated JSON
+        fp.write("\n]\n" if count else "[]\n")
+    return count
@@ -0,0 +1,30 @@
+"""Shared pytest fixtures for google-scholar-tool tests.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from collections.abc import Iterator
+
+import pytest
+
+from google_scholar_tool.cache import get_cache
+from google_scholar_tool.scholar_backends import get_backend
+
+
+@pytest.fixture(autouse=True)
+def isolated_result_cache(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Give every test a fresh, memory-only result cache."""
+    monkeypatch.delenv("GS_CACHE_DIR", raising=False)
+    get_cache.cache_clear()
+    yield
+    get_cache.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def default_backend(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Search publications through scholarly unless a test selects another backend."""
+    monkeypatch.delenv("GS_BACKEND", raising=False)
+    get_backend.cache_clear()
+    yield
+    get_backend.cache_clear()
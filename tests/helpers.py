@@ -0,0 +1,25 @@
+"""Shared test helpers for google-scholar-tool tests.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from typing import Any
+
+from google_scholar_tool.books import Book
+
+
+def make_book(authors: list[str] | None = None, **fields: Any) -> Book:
+    """Create a Book with sensible defaults; keyword arguments override fields."""
+    defaults: dict[str, Any] = {
+        "title": "Test Book",
+        "publisher": "Publisher",
+        "published_date": "2020-05-01",
+        "description": None,
+        "page_count": 100,
+        "categories": [],
+        "preview_link": None,
+        "info_link": None,
+    }
+    authors = ["Jane Doe"] if authors is None else authors
+    return Book(authors=authors, **(defaults | fields))
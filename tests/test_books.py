@@ -0,0 +1,286 @@
+"""Tests for google_scholar_tool.books module.
+
+Tests the Book dataclass citation formatting and the Google Books search
+function with a mocked HTTP layer.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import json
+from dataclasses import FrozenInstanceError
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+import urllib3
+
+from google_scholar_tool.books import (
+    _fetch_page,
+    get_api_key,
+    search_books,
+    search_books_many,
+)
+from google_scholar_tool.http_client import REQUEST_TIMEOUT
+from tests.helpers import make_book
+
+
+def make_items(count: int, offset: int = 0) -> list[dict[str, Any]]:
+    """Create raw Google Books API volume items."""
+    return [
+        {"volumeInfo": {"title": f"Book {offset + i}", "authors": ["Jane Doe"]}}
+        for i in range(count)
+    ]
+
+
+class TestBookCitations:
+    """Tests for the Book citation methods."""
+
+    def test_cite_apa(self) -> None:
+        """Test APA citation with multiple authors."""
+        book = make_book(["John Ronald Smith", "Jane Doe", "Bob Lee"])
+        assert book.cite_apa() == "Smith, J. R., Doe, J., & Lee, B. (2020). Test Book. Publisher."
+
+    def test_cite_mla_single_author(self) -> None:
+        """Test MLA citation with a single author."""
+        book = make_book(["Jane Doe"])
+        assert book.cite_mla() == "Doe, Jane. Test Book. Publisher, 2020."
+
+    def test_cite_mla_et_al(self) -> None:
+        """Test MLA citation with three or more authors uses et al."""
+        book = make_book(["Jane Doe", "John Smith", "Bob Lee"])
+        assert book.cite_mla() == "Doe, Jane, et al. Test Book. Publisher, 2020."
+
+    def test_cite_mla_author_ending_with_period(self) -> None:
+        """Test that a name ending in a period is not followed by another one."""
+        book = make_book(["John R. Smith"])
+        assert book.cite_mla() == "Smith, John R. Test Book. Publisher, 2020."
+
+    def test_cite_chicago_two_authors(self) -> None:
+        """Test Chicago citation with two authors."""
+        book = make_book(["Jane Doe", "John Smith"])
+        assert book.cite_chicago() == "Doe, Jane, and John Smith. Test Book. Publisher, 2020."
+
+    def test_cite_harvard(self) -> None:
+        """Test Harvard citation with two authors."""
+        book = make_book(["John Ronald Smith", "Jane Doe"], publisher=None)
+        assert book.cite_harvard() == "Smith, J.R. and Doe, J. (2020) Test Book. Publisher unknown."
+
+    def test_cite_irregular_whitespace(self) -> None:
+        """Test that surrounding and doubled spaces do not leak into citations."""
+        book = make_book([" Jane  Doe ", "Plato"])
+        assert book.cite_apa() == "Doe, J. & Plato (2020). Test Book. Publisher."
+
+    @pytest.mark.parametrize(
+        ("authors", "expected"),
+        [
+            (["John  Ronald Smith"], "Smith, John Ronald. Test Book. Publisher, 2020."),
+            (["a\tb"], "b, a. Test Book. Publisher, 2020."),
+            ([" Plato", "Jane Doe", "Bob Lee"], "Plato, et al. Test Book. Publisher, 2020."),
+            ([" Plato ", "Jane Doe"], "Plato, and Jane Doe. Test Book. Publisher, 2020."),
+        ],
+    )
+    def test_cite_mla_chicago_irregular_whitespace(self, authors: list[str], expected: str) -> None:
+        """Test that doubled spaces, tabs and padding are normalised in MLA and Chicago."""
+        book = make_book(authors)
+        assert book.cite_mla() == expected
+        assert book.cite_chicago() == expected
+
+    def test_cite_tab_separated_name(self) -> None:
+        """Test that tab-separated names are split in the initial-based styles."""
+        book = make_book(["a\tb"])
+        assert book.cite_apa() == "b, a. (2020). Test Book. Publisher."
+        assert book.cite_harvard() == "b, a. (2020) Test Book. Publisher."
+
+    def test_cite_unknown_author(self) -> None:
+        """Test citation without authors."""
+        book = make_book([])
+        assert book.cite("apa").startswith("Unknown Author (2020).")
+
+    def test_cite_style_is_case_insensitive(self) -> None:
+        """Test that cite() dispatches styles regardless of case."""
+        book = make_book(["Jane Doe"])
+        assert book.cite("Harvard") == book.cite_harvard()
+        assert book.cite("MLA") == book.cite_mla()
+
+    def test_cite_unsupported_style(self) -> None:
+        """Test that an unsupported style raises ValueError."""
+        with pytest.raises(ValueError, match="Unsupported style"):
+            make_book(["Jane Doe"]).cite("ieee")
+
+
+class TestBook:
+    """Tests for the Book dataclass layout."""
+
+    def test_book_is_frozen(self) -> None:
+        """Test that Book instances cannot be mutated."""
+        book = make_book(["Jane Doe"])
+        with pytest.raises(FrozenInstanceError):
+            book.title = "Other"  # type: ignore[misc]
+
+    def test_book_uses_slots(self) -> None:
+        """Test that Book instances have no per-instance __dict__."""
+        assert not hasattr(make_book(["Jane Doe"]), "__dict__")
+
+
+class TestSearchBooks:
+    """Tests for the search_books function with mocked HTTP requests."""
+
+    @patch("google_scholar_tool.books.get_api_key", return_value="key")
+    @patch("google_scholar_tool.books._fetch_page")
+    def test_search_books_basic(self, mock_fetch: MagicMock, _key: MagicMock) -> None:
+        """Test basic book search maps volume info to Book objects."""
+        mock_fetch.return_value = [
+            {
+                "volumeInfo": {
+                    "title": "Test Book",
+                    "authors": ["Jane Doe"],
+                    "industryIdentifiers": [
+                        {"type": "ISBN_10", "identifier": "0123456789"},
+                        {"type": "ISBN_13", "identifier": "9780123456789"},
+                    ],
+                }
+            }
+        ]
+
+        results = list(search_books("test", limit=5))
+
+        assert len(results) == 1
+        assert results[0].title == "Test Book"
+        assert results[0].isbn == "9780123456789"
+        mock_fetch.assert_called_once_with("test", "key", 0, 5)
+
+    @patch("google_scholar_tool.books.get_api_key", return_value="key")
+    @patch("google_scholar_tool.books._fetch_page")
+    def test_search_books_paginates(self, mock_fetch: MagicMock, _key: MagicMock) -> None:
+        """Test that limits above the API page size are split into pages."""
+        mock_fetch.side_effect = lambda query, key, start, size: make_items(size, start)
+
+        results = list(search_books("test", limit=90))
+
+        assert len(results) == 90
+        assert [r.title for r in results[:2]] == ["Book 0", "Book 1"]
+        assert results[-1].title == "Book 89"
+        pages = sorted(call.args[2:] for call in mock_fetch.call_args_list)
+        assert pages == [(0, 40), (40, 40), (80, 10)]
+
+    @patch("google_scholar_tool.books.get_api_key", return_value="key")
+    @patch("google_scholar_tool.books._fetch_page")
+    def test_search_books_empty(self, mock_fetch: MagicMock, _key: MagicMock) -> None:
+        """Test handling of empty results."""
+        mock_fetch.return_value = []
+
+        results = list(search_books("nonexistent query", limit=10))
+
+        assert len(results) == 0
+
+    @patch("google_scholar_tool.books.get_api_key", return_value="key")
+    @patch("google_scholar_tool.books._fetch_page")
+    def test_search_books_many(self, mock_fetch: MagicMock, _key: MagicMock) -> None:
+        """Test that batch searches return one result list per query, in order."""
+        mock_fetch.side_effect = lambda query, key, start, size: [
+            {"volumeInfo": {"title": f"{query} {start + i}"}} for i in range(size)
+        ]
+
+        results = search_books_many(["a", "b", "c"], limit=45)
+
+        assert [len(books) for books in results] == [45, 45, 45]
+        assert [books[0].title for books in results] == ["a 0", "b 0", "c 0"]
+        assert results[1][-1].title == "b 44"
+        assert mock_fetch.call_count == 6
+
+    @patch("google_scholar_tool.books._POOL")
+    def test_fetch_page_uses_pool(self, mock_pool: MagicMock) -> None:
+        """Test that pages are fetched through the shared connection pool."""
+        _fetch_page.cache_clear()
+        mock_pool.request.return_value = MagicMock(
+            status=200, data=json.dumps({"items": make_items(2)}).encode()
+        )
+
+        items = _fetch_page("test", "key", 0, 2)
+
+        assert [item["volumeInfo"]["title"] for item in items] == ["Book 0", "Book 1"]
+        method, url = mock_pool.request.call_args.args
+        assert method == "GET"
+        assert "startIndex=0" in url
+        assert "maxResults=2" in url
+        assert mock_pool.request.call_args.kwargs["timeout"] is REQUEST_TIMEOUT
+
+    @patch("google_scholar_tool.books._POOL")
+    def test_fetch_page_http_error(self, mock_pool: MagicMock) -> None:
+        """Test that non-200 responses raise an HTTPError."""
+        _fetch_page.cache_clear()
+        mock_pool.request.return_value = MagicMock(status=403, data=b"{}")
+
+        with pytest.raises(urllib3.exceptions.HTTPError, match="HTTP 403$"):
+            _fetch_page("test", "key", 0, 2)
+
+    @patch("google_scholar_tool.books._POOL")
+    def test_fetch_page_http_error_message(self, mock_pool: MagicMock) -> None:
+        """Test that the API's JSON error message is included in the HTTPError."""
+        _fetch_page.cache_clear()
+        body = {
+            "error": {"code": 400, "message": "API key not valid. Please pass a valid API key."}
+        }
+        mock_pool.request.return_value = MagicMock(status=400, data=json.dumps(body).encode())
+
+        with pytest.raises(
+            urllib3.exceptions.HTTPError, match="HTTP 400: API key not valid. Please pass"
+        ):
+            _fetch_page("test", "key", 0, 2)
+
+    @patch("google_scholar_tool.books._POOL")
+    def test_fetch_page_cached(self, mock_pool: MagicMock) -> None:
+        """Test that identical page requests are served from the cache."""
+        _fetch_page.cache_clear()
+        mock_pool.request.return_value = MagicMock(
+            status=200, data=json.dumps({"items": make_items(1)}).encode()
+        )
+
+        first = _fetch_page("cached", "key", 0, 1)
+        second = _fetch_page("cached", "key", 0, 1)
+
+        assert first == second
+        mock_pool.request.assert_called_once()
+        _fetch_page.cache_clear()
+
+    @patch("google_scholar_tool.books.get_api_key", return_value="key")
+    @patch("google_scholar_tool.books._POOL")
+    def test_cached_pages_not_aliased(self, mock_pool: MagicMock, _key: MagicMock) -> None:
+        """Test that mutating a returned Book does not change later cached searches."""
+        _fetch_page.cache_clear()
+        items = [{"volumeInfo": {"title": "Book", "authors": ["Jane Doe"], "categories": ["CS"]}}]
+        mock_pool.request.return_value = MagicMock(
+            status=200, data=json.dumps({"items": items}).encode()
+        )
+
+        first = next(search_books("aliased", limit=1))
+        first.authors.append("X")
+        first.categories.append("Y")
+        second = next(search_books("aliased", limit=1))
+
+        assert second.authors == ["Jane Doe"]
+        assert second.categories == ["CS"]
+        mock_pool.request.assert_called_once()
+        _fetch_page.cache_clear()
+
+    def test_search_books_missing_api_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a missing API key raises ValueError."""
+        monkeypatch.delenv("GOOGLE_BOOKS_API_KEY", raising=False)
+        get_api_key.cache_clear()
+
+        with pytest.raises(ValueError, match="GOOGLE_BOOKS_API_KEY"):
+            list(search_books("test"))
+
+    def test_get_api_key_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the API key is read from the environment only once."""
+        monkeypatch.setenv("GOOGLE_BOOKS_API_KEY", "first")
+        get_api_key.cache_clear()
+        assert get_api_key() == "first"
+
+        monkeypatch.setenv("GOOGLE_BOOKS_API_KEY", "second")
+        assert get_api_key() == "first"
+
+        get_api_key.cache_clear()
+        assert get_api_key() == "second"
+        get_api_key.cache_clear()
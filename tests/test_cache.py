@@ -0,0 +1,139 @@
+"""Tests for google_scholar_tool.cache module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from google_scholar_tool import cache as cache_module
+from google_scholar_tool.cache import ResultCache, get_cache, make_key
+
+
+class TestResultCache:
+    """Tests for the ResultCache class."""
+
+    def test_memory_roundtrip(self) -> None:
+        """Test storing and reading a value from memory."""
+        cache = ResultCache()
+        cache.set("key", [{"title": "Paper"}])
+        assert cache.get("key") == [{"title": "Paper"}]
+        assert cache.get("missing") is None
+
+    def test_values_are_copied(self) -> None:
+        """Test that mutating a stored or returned value does not change the cache."""
+        cache = ResultCache()
+        value = [{"authors": ["A"]}]
+        cache.set("key", value)
+        value[0]["authors"].append("stored")
+        cache.get("key")[0]["authors"].append("returned")
+        assert cache.get("key") == [{"authors": ["A"]}]
+
+    def test_expired_entry(self) -> None:
+        """Test that entries older than the TTL are not returned."""
+        cache = ResultCache(ttl=10)
+        with patch("google_scholar_tool.cache.time.time", return_value=1000.0):
+            cache.set("key", 1)
+        with patch("google_scholar_tool.cache.time.time", return_value=1011.0):
+            assert cache.get("key") is None
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used entry is evicted from memory."""
+        cache = ResultCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_disk_tier_persists(self, tmp_path: Path) -> None:
+        """Test that the SQLite tier survives a new cache instance."""
+        path = tmp_path / "cache.sqlite3"
+        ResultCache(path).set("key", {"name": "Ünïcode"})
+        assert ResultCache(path).get("key") == {"name": "Ünïcode"}
+
+    def test_expired_rows_purged_on_open(self, tmp_path: Path) -> None:
+        """Test that opening the cache deletes expired SQLite rows."""
+        path = tmp_path / "cache.sqlite3"
+        with patch("google_scholar_tool.cache.time.time", return_value=1000.0):
+            cache = ResultCache(path, ttl=10)
+            cache.set("old", 1)
+        with patch("google_scholar_tool.cache.time.time", return_value=1005.0):
+            cache.set("fresh", 2)
+
+        with patch("google_scholar_tool.cache.time.time", return_value=1011.0):
+            reopened = ResultCache(path, ttl=10)
+
+        assert reopened._db is not None
+        keys = [row[0] for row in reopened._db.execute("SELECT key FROM cache")]
+        assert keys == ["fresh"]
+
+    def test_clear(self, tmp_path: Path) -> None:
+        """Test that clear() empties both tiers."""
+        cache = ResultCache(tmp_path / "cache.sqlite3")
+        cache.set("key", 1)
+        cache.clear()
+        assert cache.get("key") is None
+
+
+def test_make_key_is_stable() -> None:
+    """Test that equal parts produce equal keys."""
+    assert make_key("pubs", "query", 10, None) == make_key("pubs", "query", 10, None)
+    assert make_key("pubs", "query", 10) != make_key("pubs", "query", 20)
+
+
+def test_make_key_includes_schema_version(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that bumping the schema version invalidates existing keys."""
+    key = make_key("pubs", "query")
+    monkeypatch.setattr(cache_module, "CACHE_SCHEMA_VERSION", cache_module.CACHE_SCHEMA_VERSION + 1)
+    assert make_key("pubs", "query") != key
+
+
+def test_get_cache_uses_cache_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Test that GS_CACHE_DIR enables the SQLite tier."""
+    monkeypatch.setenv("GS_CACHE_DIR", str(tmp_path))
+    get_cache.cache_clear()
+    get_cache().set("key", 1)
+    assert (tmp_path / "cache.sqlite3").exists()
+
+
+@pytest.mark.parametrize("ttl", ["abc", "-5", "nan"])
+def test_get_cache_rejects_invalid_ttl(monkeypatch: pytest.MonkeyPatch, ttl: str) -> None:
+    """Test that an invalid GS_CACHE_TTL raises one clear ValueError."""
+    monkeypatch.setenv("GS_CACHE_TTL", ttl)
+    get_cache.cache_clear()
+    with pytest.raises(ValueError, match="GS_CACHE_TTL must be a non-negative number"):
+        get_cache()
+
+
+def test_get_cache_corrupt_file_falls_back_to_memory(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that a corrupt SQLite file is reported and the cache stays usable."""
+    (tmp_path / "cache.sqlite3").write_bytes(b"not a database" * 100)
+    monkeypatch.setenv("GS_CACHE_DIR", str(tmp_path))
+    get_cache.cache_clear()
+
+    cache = get_cache()
+    cache.set("key", 1)
+
+    assert cache.get("key") == 1
+    assert "caching in memory only" in caplog.text
+
+
+def test_get_cache_unusable_dir_falls_back_to_memory(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that a GS_CACHE_DIR that cannot be created falls back to memory."""
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    monkeypatch.setenv("GS_CACHE_DIR", str(blocker / "cache"))
+    get_cache.cache_clear()
+
+    assert get_cache().get("key") is None
+    assert "caching in memory only" in caplog.text
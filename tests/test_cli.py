@@ -7,19 +7,74 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
-from unittest.mock import MagicMock, patch
-
+import json
+import subprocess
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
 from click.testing import CliRunner
 
 from google_scholar_tool.cli import main
+from google_scholar_tool.scholar import Publication
+from tests.helpers import make_book
+
+PUBLICATION = Publication(
+    title="Test Paper",
+    authors=["Author"],
+    year="2024",
+    abstract="Abstract",
+    citations=10,
+    url=None,
+    pub_url=None,
+)
+
+
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    """Share one CliRunner across the tests in this module."""
+    return CliRunner()
+
+
+@pytest.fixture
+def mock_search_publications(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace search_publications with a mock yielding no results."""
+    mock = MagicMock(return_value=iter([]))
+    monkeypatch.setattr("google_scholar_tool.scholar.search_publications", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_search_authors(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace search_authors with a mock yielding no results."""
+    mock = MagicMock(return_value=iter([]))
+    monkeypatch.setattr("google_scholar_tool.scholar.search_authors", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_search_books_many(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace search_books_many with a mock: one book for the first query, none for the second."""
+    mock = MagicMock(return_value=[[make_book(title="First", publisher="Pub")], []])
+    monkeypatch.setattr("google_scholar_tool.books.search_books_many", mock)
+    return mock
+
+
+@pytest.fixture
+def batch_file(tmp_path: Path) -> Path:
+    """Write a batch file with two queries and a blank line."""
+    path = tmp_path / "queries.txt"
+    path.write_text("python\n\nrust\n")
+    return path
 
 
 class TestMainCommand:
     """Tests for the main CLI command."""
 
-    def test_main_help(self) -> None:
+    def test_main_help(self, runner: CliRunner) -> None:
         """Test that main --help shows usage info."""
-        runner = CliRunner()
         result = runner.invoke(main, ["--help"])
 
         assert result.exit_code == 0
@@ -27,29 +82,36 @@ class TestMainCommand:
         assert "search" in result.output
         assert "author" in result.output
 
-    def test_main_version(self) -> None:
+    def test_main_version(self, runner: CliRunner) -> None:
         """Test that --version shows version info."""
-        runner = CliRunner()
         result = runner.invoke(main, ["--version"])
 
         assert result.exit_code == 0
         assert "0.1.0" in result.output
 
-    def test_main_no_command_shows_help(self) -> None:
+    def test_main_no_command_shows_help(self, runner: CliRunner) -> None:
         """Test that running without command shows help."""
-        runner = CliRunner()
         result = runner.invoke(main, [])
 
         assert result.exit_code == 0
         assert "Google Scholar CLI tool" in result.output
 
+    def test_cli_import_is_lazy(self) -> None:
+        """Test that importing the CLI does not import scholarly or urllib3."""
+        code = (
+            "import sys, google_scholar_tool.cli; "
+            "sys.exit(int('scholarly' in sys.modules or 'urllib3' in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], check=False)  # nosec B603
+
+        assert result.returncode == 0
+
 
 class TestSearchCommand:
     """Tests for the search subcommand."""
 
-    def test_search_help(self) -> None:
+    def test_search_help(self, runner: CliRunner) -> None:
         """Test that search --help shows usage info."""
-        runner = CliRunner()
         result = runner.invoke(main, ["search", "--help"])
 
         assert result.exit_code == 0
@@ -57,128 +119,242 @@ class TestSearchCommand:
         assert "--exact" in result.output
         assert "--intitle" in result.output
 
-    def test_search_missing_query(self) -> None:
+    def test_search_missing_query(self, runner: CliRunner) -> None:
         """Test that missing query shows error with fix suggestion."""
-        runner = CliRunner()
         result = runner.invoke(main, ["search"])
 
         assert result.exit_code == 1
         assert "Error:" in result.output
         assert "Fix:" in result.output
 
-    @patch("google_scholar_tool.cli.search_publications")
-    def test_search_executes(self, mock_search: MagicMock) -> None:
+    def test_search_executes(self, runner: CliRunner, mock_search_publications: MagicMock) -> None:
         """Test executing search."""
-        mock_search.return_value = iter([])
-
-        runner = CliRunner()
         result = runner.invoke(main, ["search", "test"])
 
         assert result.exit_code == 0
-        mock_search.assert_called_once()
+        mock_search_publications.assert_called_once()
 
-    @patch("google_scholar_tool.cli.search_publications")
-    def test_search_json_output(self, mock_search: MagicMock) -> None:
+    def test_search_json_output(
+        self, runner: CliRunner, mock_search_publications: MagicMock
+    ) -> None:
         """Test JSON output format."""
-        from google_scholar_tool.scholar import Publication
-
-        mock_pub = Publication(
-            title="Test Paper",
-            authors=["Author"],
-            year="2024",
-            abstract="Abstract",
-            citations=10,
-            url=None,
-            pub_url=None,
-        )
-        mock_search.return_value = iter([mock_pub])
+        mock_search_publications.return_value = iter([PUBLICATION])
 
-        runner = CliRunner()
         result = runner.invoke(main, ["search", "test", "--json-output"])
 
         assert result.exit_code == 0
         assert '"title": "Test Paper"' in result.output
+        assert json.loads(result.output) == [PUBLICATION.to_dict()]
 
-    @patch("google_scholar_tool.cli.search_publications")
-    def test_search_with_exact(self, mock_search: MagicMock) -> None:
-        """Test search with exact phrase option."""
-        mock_search.return_value = iter([])
+    def test_search_json_output_failing_midway(
+        self, runner: CliRunner, mock_search_publications: MagicMock
+    ) -> None:
+        """Test that a search failing after the first record leaves valid JSON."""
+
+        def failing() -> Iterator[Publication]:
+            yield PUBLICATION
+            raise RuntimeError("rate limited")
 
-        runner = CliRunner()
+        mock_search_publications.return_value = failing()
+
+        result = runner.invoke(main, ["search", "test", "--json-output"])
+
+        assert result.exit_code == 1
+        assert isinstance(result.exception, RuntimeError)
+        assert json.loads(result.stdout) == [PUBLICATION.to_dict()]
+
+    def test_search_text_output(
+        self, runner: CliRunner, mock_search_publications: MagicMock
+    ) -> None:
+        """Test human-readable output lists each result in order."""
+        mock_search_publications.return_value = iter(
+            [
+                Publication(
+                    title=f"Paper {i}",
+                    authors=["Author"],
+                    year="2024",
+                    abstract=None,
+                    citations=i,
+                    url=None,
+                    pub_url=None,
+                )
+                for i in (1, 2)
+            ]
+        )
+
+        result = runner.invoke(main, ["search", "test"])
+
+        assert result.exit_code == 0
+        assert result.output == (
+            "\n1. Paper 1\n   Authors: Author\n   Year: 2024\n   Citations: 1\n"
+            "\n2. Paper 2\n   Authors: Author\n   Year: 2024\n   Citations: 2\n"
+        )
+
+    def test_search_with_exact(
+        self, runner: CliRunner, mock_search_publications: MagicMock
+    ) -> None:
+        """Test search with exact phrase option."""
         result = runner.invoke(main, ["search", "HRM", "--exact", "job satisfaction"])
 
         assert result.exit_code == 0
-        mock_search.assert_called_once()
+        mock_search_publications.assert_called_once()
 
-    @patch("google_scholar_tool.cli.search_publications")
-    def test_search_with_intitle(self, mock_search: MagicMock) -> None:
+    def test_search_with_intitle(
+        self, runner: CliRunner, mock_search_publications: MagicMock
+    ) -> None:
         """Test search with intitle option."""
-        mock_search.return_value = iter([])
-
-        runner = CliRunner()
         result = runner.invoke(
             main,
             ["search", "HRM", "--exact", "job satisfaction", "--intitle", "Netherlands"],
         )
 
         assert result.exit_code == 0
-        mock_search.assert_called_once()
+        mock_search_publications.assert_called_once()
 
 
 class TestAuthorCommand:
     """Tests for the author subcommand."""
 
-    def test_author_help(self) -> None:
+    def test_author_help(self, runner: CliRunner) -> None:
         """Test that author --help shows usage info."""
-        runner = CliRunner()
         result = runner.invoke(main, ["author", "--help"])
 
         assert result.exit_code == 0
         assert "Search Google Scholar for authors" in result.output
         assert "--scholar-id" in result.output
 
-    def test_author_missing_query_and_id(self) -> None:
+    def test_author_missing_query_and_id(self, runner: CliRunner) -> None:
         """Test that missing query and ID shows error with fix suggestion."""
-        runner = CliRunner()
         result = runner.invoke(main, ["author"])
 
         assert result.exit_code == 1
         assert "Error:" in result.output
         assert "Fix:" in result.output
 
-    @patch("google_scholar_tool.cli.search_authors")
-    def test_author_executes(self, mock_search: MagicMock) -> None:
+    def test_author_executes(self, runner: CliRunner, mock_search_authors: MagicMock) -> None:
         """Test executing author search."""
-        mock_search.return_value = iter([])
-
-        runner = CliRunner()
         result = runner.invoke(main, ["author", "Test"])
 
         assert result.exit_code == 0
-        mock_search.assert_called_once()
+        mock_search_authors.assert_called_once()
+
+    @pytest.mark.parametrize("args", [["author", "Test"], ["author", "--scholar-id", "ABC"]])
+    def test_author_invalid_cache_ttl(
+        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch, args: list[str]
+    ) -> None:
+        """Test that a bad GS_CACHE_TTL is reported as an error, not a traceback."""
+        monkeypatch.setenv("GS_CACHE_TTL", "abc")
+
+        result = runner.invoke(main, args)
+
+        assert result.exit_code == 1
+        assert "Error: GS_CACHE_TTL must be a non-negative number" in result.output
+
+    def test_author_invalid_max_retries(
+        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a bad GS_MAX_RETRIES is reported as an error, not 'Author not found'."""
+        monkeypatch.setenv("GS_MAX_RETRIES", "x")
+
+        result = runner.invoke(main, ["author", "--scholar-id", "ABC"])
+
+        assert result.exit_code == 1
+        assert "Error: GS_MAX_RETRIES must be a positive integer" in result.output
+        assert "Author not found" not in result.output
+
+
+class TestBooksCommand:
+    """Tests for the books subcommand."""
+
+    def test_books_missing_query(self, runner: CliRunner) -> None:
+        """Test that missing query shows error with fix suggestion."""
+        result = runner.invoke(main, ["books"])
+
+        assert result.exit_code == 1
+        assert "Error:" in result.output
+        assert "Fix:" in result.output
+
+    def test_books_batch_file(
+        self, runner: CliRunner, batch_file: Path, mock_search_books_many: MagicMock
+    ) -> None:
+        """Test that --batch-file searches every non-empty line and cites the results."""
+        mock_search_books_many.return_value[1] = [make_book(title="Second", publisher="Pub")]
+
+        result = runner.invoke(
+            main, ["books", "--batch-file", str(batch_file), "--cite", "apa", "--limit", "1"]
+        )
+
+        assert result.exit_code == 0
+        mock_search_books_many.assert_called_once_with(["python", "rust"], limit=1)
+        assert result.output == "Doe, J. (2020). First. Pub.\nDoe, J. (2020). Second. Pub.\n"
+
+    @pytest.mark.usefixtures("mock_search_books_many")
+    def test_books_batch_json_groups_by_query(self, runner: CliRunner, batch_file: Path) -> None:
+        """Test that batch JSON output keeps each query's results together."""
+        result = runner.invoke(main, ["books", "--batch-file", str(batch_file), "--json-output"])
+
+        assert result.exit_code == 0
+        output = json.loads(result.output)
+        assert [group["query"] for group in output] == ["python", "rust"]
+        assert [book["title"] for book in output[0]["results"]] == ["First"]
+        assert output[1]["results"] == []
+
+    def test_books_one_line_batch_is_grouped(
+        self, runner: CliRunner, tmp_path: Path, mock_search_books_many: MagicMock
+    ) -> None:
+        """Test that a one-line batch file still produces grouped JSON."""
+        mock_search_books_many.return_value = [[make_book(title="Only")]]
+        path = tmp_path / "one.txt"
+        path.write_text("python\n")
+
+        result = runner.invoke(main, ["books", "--batch-file", str(path), "--json-output"])
+
+        assert result.exit_code == 0
+        mock_search_books_many.assert_called_once_with(["python"], limit=10)
+        output = json.loads(result.output)
+        assert output[0]["query"] == "python"
+        assert [book["title"] for book in output[0]["results"]] == ["Only"]
+
+    @pytest.mark.usefixtures("mock_search_books_many")
+    def test_books_batch_text_groups_by_query(self, runner: CliRunner, batch_file: Path) -> None:
+        """Test that batch text output has a header per query and restarts numbering."""
+        result = runner.invoke(main, ["books", "--batch-file", str(batch_file)])
+
+        assert result.exit_code == 0
+        assert result.output.startswith("\n=== python ===\n\n1. First\n")
+        assert result.output.endswith("\n=== rust ===\nNo results found\n")
 
 
 class TestQuietMode:
     """Tests for quiet mode."""
 
-    @patch("google_scholar_tool.cli.search_publications")
-    def test_search_quiet(self, mock_search: MagicMock) -> None:
+    def test_search_quiet(self, runner: CliRunner, mock_search_publications: MagicMock) -> None:
         """Test that quiet mode suppresses output."""
-        mock_search.return_value = iter([])
-
-        runner = CliRunner()
         result = runner.invoke(main, ["-q", "search", "test"])
 
         assert result.exit_code == 0
         assert result.output == ""
 
-    @patch("google_scholar_tool.cli.search_authors")
-    def test_author_quiet(self, mock_search: MagicMock) -> None:
+    def test_author_quiet(self, runner: CliRunner, mock_search_authors: MagicMock) -> None:
         """Test that quiet mode suppresses author output."""
-        mock_search.return_value = iter([])
-
-        runner = CliRunner()
         result = runner.invoke(main, ["-q", "author", "test"])
 
         assert result.exit_code == 0
         assert result.output == ""
+
+
+class TestCompletionCommand:
+    """Tests for the completion subcommand."""
+
+    def test_completion_bash(self, runner: CliRunner) -> None:
+        """Test that a bash completion script is generated."""
+        result = runner.invoke(main, ["completion", "bash"])
+
+        assert result.exit_code == 0
+        assert "_google_scholar_tool_completion" in result.output
+
+    def test_completion_unsupported_shell(self, runner: CliRunner) -> None:
+        """Test that an unsupported shell is rejected."""
+        result = runner.invoke(main, ["completion", "powershell"])
+
+        assert result.exit_code != 0
@@ -0,0 +1,51 @@
+"""Tests for google_scholar_tool.http_client module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import json
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+import urllib3
+
+from google_scholar_tool.http_client import REQUEST_TIMEOUT, get_json
+
+
+def mock_pool(status: int, body: object) -> MagicMock:
+    """Create a connection pool mock returning a single JSON response."""
+    pool = MagicMock()
+    pool.request.return_value = MagicMock(status=status, data=json.dumps(body).encode())
+    return pool
+
+
+def test_get_json_decodes_body(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that the body is decoded and the API key is redacted from the log."""
+    pool = mock_pool(200, {"items": [1, 2]})
+
+    with caplog.at_level(logging.DEBUG, logger="google_scholar_tool.http_client"):
+        data = get_json(pool, "https://example.com/?key=secret", "Example", "secret")
+
+    assert data == {"items": [1, 2]}
+    assert pool.request.call_args.kwargs["timeout"] is REQUEST_TIMEOUT
+    assert "key=***" in caplog.text
+    assert "secret" not in caplog.text
+
+
+@pytest.mark.parametrize(
+    ("body", "expected"),
+    [
+        ({"error": {"code": 400, "message": "Bad key"}}, "HTTP 400: Bad key$"),
+        ({"error": "Bad key"}, "HTTP 400: Bad key$"),
+        ({}, "HTTP 400$"),
+        (["unexpected"], "HTTP 400$"),
+    ],
+)
+def test_get_json_http_error(body: object, expected: str) -> None:
+    """Test that non-200 responses raise an HTTPError with the API's message."""
+    with pytest.raises(
+        urllib3.exceptions.HTTPError, match=f"Example request failed with {expected}"
+    ):
+        get_json(mock_pool(400, body), "https://example.com/", "Example", "secret")
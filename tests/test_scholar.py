@@ -8,15 +8,26 @@ and has been reviewed and tested by a human.
 """
 
 import json
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
+import pytest
+from scholarly import MaxTriesExceededException
+
 from google_scholar_tool.scholar import (
     Author,
     Publication,
+    _enable_fast_parser,
+    _prefetch_iter,
     build_query,
+    get_author_details,
     search_authors,
     search_publications,
+    search_publications_many,
 )
+from google_scholar_tool.scholar_backends import SerpApiBackend
 
 
 class TestBuildQuery:
@@ -45,6 +56,11 @@ class TestBuildQuery:
         )
         assert result == 'AI AND "machine learning" AND "deep learning"'
 
+    def test_exact_phrases_without_terms(self) -> None:
+        """Test that single-word phrases are not quoted and need no main terms."""
+        result = build_query(terms=[], exact_phrases=["burnout", "job satisfaction"])
+        assert result == 'burnout AND "job satisfaction"'
+
     def test_intitle_filter(self) -> None:
         """Test query with intitle filter."""
         result = build_query(
@@ -94,6 +110,55 @@ class TestBuildQuery:
         assert "OR" in result
 
 
+class TestPrefetchIter:
+    """Tests for the background prefetching iterator."""
+
+    @pytest.mark.parametrize("ahead", [0, 1, 3])
+    def test_preserves_order(self, ahead: int) -> None:
+        """Test that items are yielded in order for any buffer size."""
+        assert list(_prefetch_iter(range(10), ahead=ahead)) == list(range(10))
+
+    def test_reraises_errors(self) -> None:
+        """Test that an exception in the source is raised in the consumer."""
+
+        def failing() -> Iterator[int]:
+            yield 1
+            raise RuntimeError("captcha")
+
+        results = []
+        with pytest.raises(RuntimeError, match="captcha"):
+            for item in _prefetch_iter(failing()):
+                results.append(item)
+        assert results == [1]
+
+    def test_close_stops_worker(self) -> None:
+        """Test that closing the generator stops the worker thread."""
+        iterator = _prefetch_iter(iter(range(1000)), ahead=1)
+        assert next(iterator) == 0
+        workers = [t for t in threading.enumerate() if t.name == "scholar-prefetch"]
+        iterator.close()
+
+        for worker in workers:
+            worker.join(timeout=2)
+        assert not any(worker.is_alive() for worker in workers)
+
+
+class TestFastParser:
+    """Tests for the opt-in lxml parser switch."""
+
+    def test_enable_fast_parser_uses_lxml(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that scholarly's soups are built with the lxml parser."""
+        pytest.importorskip("lxml")
+        from scholarly import _navigator
+
+        monkeypatch.setattr(_navigator, "BeautifulSoup", _navigator.BeautifulSoup)
+
+        assert _enable_fast_parser() is True
+        soup = _navigator.BeautifulSoup("<div class='gs_ri'>x</div>", "html.parser")
+        assert soup.builder.NAME == "lxml"
+        assert soup.find("div", class_="gs_ri").text == "x"
+
+
 class TestPublication:
     """Tests for the Publication dataclass."""
 
@@ -144,6 +209,27 @@ class TestPublication:
         parsed = json.loads(result)
         assert parsed["title"] == "Test Paper"
 
+    def test_publication_from_search_result(self) -> None:
+        """Test building a Publication from a raw scholarly result with defaults."""
+        pub = Publication.from_search_result({"bib": {"pub_year": "2021"}, "pub_url": "u"})
+        assert pub.title == "Unknown"
+        assert pub.authors == []
+        assert pub.year == "2021"
+        assert pub.citations == 0
+        assert pub.pub_url == "u"
+
+    def test_publication_from_search_result_without_bib(self) -> None:
+        """Test that a result with a null bib or author list still maps cleanly."""
+        pub = Publication.from_search_result({"bib": None, "num_citations": 3})
+        assert pub.title == "Unknown"
+        assert pub.authors == []
+        assert pub.citations == 3
+
+    def test_publication_uses_slots(self) -> None:
+        """Test that Publication instances have no per-instance __dict__."""
+        pub = Publication("T", [], None, None, 0, None, None)
+        assert not hasattr(pub, "__dict__")
+
 
 class TestAuthor:
     """Tests for the Author dataclass."""
@@ -198,11 +284,24 @@ class TestAuthor:
         assert parsed["name"] == "Test Author"
         assert parsed["h_index"] == 5
 
+    def test_author_from_search_result(self) -> None:
+        """Test building an Author from a raw scholarly result with defaults."""
+        author = Author.from_search_result({"name": "Jane Doe", "hindex": 7})
+        assert author.name == "Jane Doe"
+        assert author.h_index == 7
+        assert author.citations == 0
+        assert author.interests == []
+
+    def test_author_uses_slots(self) -> None:
+        """Test that Author instances have no per-instance __dict__."""
+        author = Author("A", None, None, 0, 0, 0, [], None)
+        assert not hasattr(author, "__dict__")
+
 
 class TestSearchPublications:
     """Tests for the search_publications function with mocked scholarly."""
 
-    @patch("google_scholar_tool.scholar.scholarly")
+    @patch("google_scholar_tool.scholar_backends.scholarly")
     def test_search_publications_basic(self, mock_scholarly: MagicMock) -> None:
         """Test basic publication search with mocked results."""
         mock_result = {
@@ -224,19 +323,55 @@ class TestSearchPublications:
         assert results[0].title == "Test Paper"
         assert results[0].citations == 100
 
-    @patch("google_scholar_tool.scholar.scholarly")
+    @patch("google_scholar_tool.scholar_backends.scholarly")
     def test_search_publications_limit(self, mock_scholarly: MagicMock) -> None:
         """Test that limit is respected."""
         mock_results = [
             {"bib": {"title": f"Paper {i}", "author": []}, "num_citations": i} for i in range(10)
         ]
-        mock_scholarly.search_pubs.return_value = iter(mock_results)
+        mock_iter = iter(mock_results)
+        mock_scholarly.search_pubs.return_value = mock_iter
 
         results = list(search_publications("test", limit=3))
 
         assert len(results) == 3
+        # No result beyond the limit is pulled from scholarly (each costs a page fetch)
+        assert next(mock_iter)["num_citations"] == 3
 
-    @patch("google_scholar_tool.scholar.scholarly")
+    @patch("google_scholar_tool.scholar_backends.scholarly")
+    def test_search_publications_cached(self, mock_scholarly: MagicMock) -> None:
+        """Test that a repeated search is served from the result cache."""
+        mock_results = [{"bib": {"title": "Cached Paper", "author": []}, "num_citations": 1}]
+        mock_scholarly.search_pubs.return_value = iter(mock_results)
+
+        first = list(search_publications("cached", limit=5))
+        second = list(search_publications("cached", limit=5))
+
+        assert first == second
+        mock_scholarly.search_pubs.assert_called_once()
+
+    @patch("google_scholar_tool.scholar_backends.scholarly")
+    def test_search_publications_cache_not_aliased(self, mock_scholarly: MagicMock) -> None:
+        """Test that mutating a returned publication does not leak into cache hits."""
+        mock_results = [{"bib": {"title": "Paper", "author": ["A"]}}]
+        mock_scholarly.search_pubs.return_value = iter(mock_results)
+
+        list(search_publications("aliased"))[0].authors.append("INJECTED")
+        list(search_publications("aliased"))[0].authors.append("INJECTED")
+
+        assert next(search_publications("aliased")).authors == ["A"]
+
+    @patch("google_scholar_tool.scholar_backends.scholarly")
+    def test_search_publications_cache_bypass(self, mock_scholarly: MagicMock) -> None:
+        """Test that cache_bypass always queries scholarly."""
+        mock_scholarly.search_pubs.side_effect = lambda *args, **kwargs: iter([])
+
+        list(search_publications("bypass", cache_bypass=True))
+        list(search_publications("bypass", cache_bypass=True))
+
+        assert mock_scholarly.search_pubs.call_count == 2
+
+    @patch("google_scholar_tool.scholar_backends.scholarly")
     def test_search_publications_empty(self, mock_scholarly: MagicMock) -> None:
         """Test handling of empty results."""
         mock_scholarly.search_pubs.return_value = iter([])
@@ -246,6 +381,67 @@ class TestSearchPublications:
         assert len(results) == 0
 
 
+class TestSearchPublicationsMany:
+    """Tests for the search_publications_many function with mocked scholarly."""
+
+    @patch("google_scholar_tool.scholar_backends.scholarly")
+    def test_results_per_query_in_order(
+        self, mock_scholarly: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that each query gets its own result list, in query order."""
+        monkeypatch.setenv("GS_MAX_CONCURRENCY", "3")
+        mock_scholarly.search_pubs.side_effect = lambda query, **kwargs: iter(
+            [{"bib": {"title": f"{query} {i}"}} for i in range(5)]
+        )
+
+        results = search_publications_many(["a", "b", "c"], limit=2)
+
+        assert [[pub.title for pub in pubs] for pubs in results] == [
+            ["a 0", "a 1"],
+            ["b 0", "b 1"],
+            ["c 0", "c 1"],
+        ]
+
+    @patch("google_scholar_tool.scholar.ThreadPoolExecutor", wraps=ThreadPoolExecutor)
+    @patch("google_scholar_tool.scholar_backends.scholarly")
+    def test_scholarly_runs_one_query_at_a_time(
+        self, mock_scholarly: MagicMock, mock_executor: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the thread-unsafe scholarly backend gets a single worker."""
+        monkeypatch.setenv("GS_MAX_CONCURRENCY", "3")
+        mock_scholarly.search_pubs.return_value = iter([])
+
+        search_publications_many(["a", "b", "c"])
+
+        assert mock_executor.call_args.kwargs["max_workers"] == 1
+
+    @patch("google_scholar_tool.scholar.ThreadPoolExecutor", wraps=ThreadPoolExecutor)
+    def test_serpapi_runs_queries_concurrently(
+        self, mock_executor: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the SerpApi backend runs up to GS_MAX_CONCURRENCY queries at once."""
+        monkeypatch.setenv("GS_BACKEND", "serpapi")
+        monkeypatch.setenv("GS_SERPAPI_KEY", "key")
+        monkeypatch.setenv("GS_MAX_CONCURRENCY", "2")
+
+        with patch.object(SerpApiBackend, "iter_pubs", return_value=iter([])):
+            search_publications_many(["a", "b", "c"])
+
+        assert mock_executor.call_args.kwargs["max_workers"] == 2
+
+    @pytest.mark.parametrize("setting", ["two", "0", "-1"])
+    def test_invalid_max_concurrency(self, setting: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a GS_MAX_CONCURRENCY below 1 or non-numeric raises ValueError."""
+        monkeypatch.setenv("GS_MAX_CONCURRENCY", setting)
+
+        with pytest.raises(ValueError, match="GS_MAX_CONCURRENCY must be a positive integer"):
+            search_publications_many(["a"])
+
+    def test_no_queries(self) -> None:
+        """Test that an empty query list returns no results."""
+        assert search_publications_many([]) == []
+
+
 class TestSearchAuthors:
     """Tests for the search_authors function with mocked scholarly."""
 
@@ -278,3 +474,93 @@ class TestSearchAuthors:
         results = list(search_authors("nonexistent author", limit=10))
 
         assert len(results) == 0
+
+
+class TestGetAuthorDetails:
+    """Tests for the get_author_details function with mocked scholarly."""
+
+    @patch("google_scholar_tool.scholar.scholarly")
+    def test_get_author_details_cached(self, mock_scholarly: MagicMock) -> None:
+        """Test that author details are fetched once and then served from cache."""
+        mock_scholarly.search_author_id.return_value = {"name": "Test Author"}
+        mock_scholarly.fill.return_value = {
+            "name": "Test Author",
+            "citedby": 10,
+            "hindex": 2,
+            "i10index": 1,
+            "scholar_id": "ABC123",
+        }
+
+        first = get_author_details("ABC123")
+        second = get_author_details("ABC123")
+
+        assert first is not None
+        assert first == second
+        assert first.h_index == 2
+        mock_scholarly.search_author_id.assert_called_once_with("ABC123")
+        mock_scholarly.fill.assert_called_once_with(
+            {"name": "Test Author"}, sections=["basics", "indices"]
+        )
+
+    @patch("google_scholar_tool.scholar.scholarly")
+    def test_get_author_details_without_sections(self, mock_scholarly: MagicMock) -> None:
+        """Test that an empty sections tuple skips the fill request."""
+        mock_scholarly.search_author_id.return_value = {"name": "Test Author", "citedby": 5}
+
+        author = get_author_details("ABC123", sections=())
+
+        assert author is not None
+        assert author.citations == 5
+        mock_scholarly.fill.assert_not_called()
+
+    @patch("google_scholar_tool.scholar.time.sleep")
+    @patch("google_scholar_tool.scholar.scholarly")
+    def test_get_author_details_retries_when_rate_limited(
+        self, mock_scholarly: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """Test that a rate-limit error is retried after a backoff."""
+        mock_scholarly.search_author_id.side_effect = [
+            MaxTriesExceededException("captcha"),
+            {"name": "Test Author"},
+        ]
+
+        author = get_author_details("ABC123", sections=())
+
+        assert author is not None
+        assert author.name == "Test Author"
+        mock_sleep.assert_called_once()
+        assert 1 <= mock_sleep.call_args.args[0] <= 2
+
+    @patch("google_scholar_tool.scholar.time.sleep")
+    @patch("google_scholar_tool.scholar.scholarly")
+    def test_get_author_details_gives_up_after_max_retries(
+        self, mock_scholarly: MagicMock, mock_sleep: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that lookups stop after GS_MAX_RETRIES attempts."""
+        monkeypatch.setenv("GS_MAX_RETRIES", "2")
+        mock_scholarly.search_author_id.side_effect = MaxTriesExceededException("captcha")
+
+        assert get_author_details("ABC123") is None
+        assert mock_scholarly.search_author_id.call_count == 2
+        assert mock_sleep.call_count == 1
+
+    @pytest.mark.parametrize("retries", ["x", "0"])
+    @patch("google_scholar_tool.scholar.scholarly")
+    def test_get_author_details_invalid_max_retries(
+        self, mock_scholarly: MagicMock, monkeypatch: pytest.MonkeyPatch, retries: str
+    ) -> None:
+        """Test that a bad GS_MAX_RETRIES raises instead of looking up nothing."""
+        monkeypatch.setenv("GS_MAX_RETRIES", retries)
+
+        with pytest.raises(ValueError, match="GS_MAX_RETRIES must be a positive integer"):
+            get_author_details("ABC123")
+        mock_scholarly.search_author_id.assert_not_called()
+
+    @patch("google_scholar_tool.scholar.scholarly")
+    def test_get_author_details_failure_not_cached(self, mock_scholarly: MagicMock) -> None:
+        """Test that failed lookups return None and are retried on the next call."""
+        mock_scholarly.search_author_id.side_effect = RuntimeError("blocked")
+
+        assert get_author_details("ABC123") is None
+        assert get_author_details("ABC123") is None
+        assert mock_scholarly.search_author_id.call_count == 2
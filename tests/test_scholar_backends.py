@@ -0,0 +1,190 @@
+"""Tests for google_scholar_tool.scholar_backends module.
+
+Tests backend selection and the SerpApi backend with a mocked HTTP layer.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import json
+import urllib.parse
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+import urllib3
+
+from google_scholar_tool.scholar import search_publications
+from google_scholar_tool.scholar_backends import (
+    SERPAPI_URL,
+    ScholarlyBackend,
+    SerpApiBackend,
+    _to_scholarly_result,
+    get_backend,
+)
+
+
+def make_results(count: int, offset: int = 0) -> list[dict[str, Any]]:
+    """Create raw SerpApi organic results."""
+    return [{"title": f"Paper {offset + i}"} for i in range(count)]
+
+
+def page_response(page: list[dict[str, Any]], has_next: bool) -> MagicMock:
+    """Create an HTTP response mock for one page of SerpApi results."""
+    pagination = {"next": SERPAPI_URL} if has_next else {}
+    body = {"organic_results": page, "serpapi_pagination": pagination}
+    return MagicMock(status=200, data=json.dumps(body).encode())
+
+
+def mock_pool(*pages: list[dict[str, Any]], has_next: bool | None = None) -> MagicMock:
+    """Create a connection pool mock returning one response per page.
+
+    Every page but the last links to a next page unless has_next says otherwise.
+    """
+    pool = MagicMock()
+    pool.request.side_effect = [
+        page_response(page, i < len(pages) - 1 if has_next is None else has_next)
+        for i, page in enumerate(pages)
+    ]
+    return pool
+
+
+def request_params(pool: MagicMock, call: int = 0) -> dict[str, str]:
+    """Return the query parameters of a recorded pool request."""
+    url = pool.request.call_args_list[call].args[1]
+    return dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(url).query))
+
+
+class TestGetBackend:
+    """Tests for backend selection from the environment."""
+
+    def test_default_is_scholarly(self) -> None:
+        """Test that scholarly is used when GS_BACKEND is unset."""
+        assert isinstance(get_backend(), ScholarlyBackend)
+
+    def test_serpapi(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that GS_BACKEND=serpapi selects SerpApi with the configured key."""
+        monkeypatch.setenv("GS_BACKEND", "serpapi")
+        monkeypatch.setenv("GS_SERPAPI_KEY", "key")
+
+        backend = get_backend()
+
+        assert isinstance(backend, SerpApiBackend)
+        assert backend.api_key == "key"
+
+    def test_serpapi_missing_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that selecting SerpApi without a key raises ValueError."""
+        monkeypatch.setenv("GS_BACKEND", "serpapi")
+        monkeypatch.delenv("GS_SERPAPI_KEY", raising=False)
+
+        with pytest.raises(ValueError, match="GS_SERPAPI_KEY"):
+            get_backend()
+
+    def test_unknown_backend(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that an unknown backend name raises ValueError."""
+        monkeypatch.setenv("GS_BACKEND", "bing")
+
+        with pytest.raises(ValueError, match="Unknown GS_BACKEND"):
+            get_backend()
+
+
+class TestSerpApiBackend:
+    """Tests for the SerpApi backend with a mocked connection pool."""
+
+    def test_iter_pubs_paginates_lazily(self) -> None:
+        """Test that pages are requested on demand until there is no next page."""
+        backend = SerpApiBackend("key")
+        backend._pool = mock_pool(make_results(20), make_results(3, 20))
+
+        results = backend.iter_pubs("HRM", 2020, None, "date")
+        first = next(results)
+
+        assert first["bib"]["title"] == "Paper 0"
+        assert backend._pool.request.call_count == 1
+
+        rest = list(results)
+
+        assert len(rest) == 22
+        assert rest[-1]["bib"]["title"] == "Paper 22"
+        assert request_params(backend._pool, 0) == {
+            "engine": "google_scholar",
+            "q": "HRM",
+            "api_key": "key",
+            "num": "20",
+            "as_ylo": "2020",
+            "scisbd": "1",
+            "start": "0",
+        }
+        assert request_params(backend._pool, 1)["start"] == "20"
+
+    def test_iter_pubs_follows_next_after_short_page(self) -> None:
+        """Test that a short page with a next link does not end the results."""
+        backend = SerpApiBackend("key")
+        backend._pool = mock_pool(make_results(18), make_results(5, 18))
+
+        results = list(backend.iter_pubs("HRM", None, None, "relevance"))
+
+        assert len(results) == 23
+        assert request_params(backend._pool, 1)["start"] == "20"
+
+    def test_iter_pubs_stops_without_next(self) -> None:
+        """Test that a full page without a next link is the last page."""
+        backend = SerpApiBackend("key")
+        backend._pool = mock_pool(make_results(20), make_results(20, 20), has_next=False)
+
+        results = list(backend.iter_pubs("HRM", None, None, "relevance"))
+
+        assert len(results) == 20
+        assert backend._pool.request.call_count == 1
+
+    def test_http_error(self) -> None:
+        """Test that non-200 responses raise an HTTPError with SerpApi's message."""
+        backend = SerpApiBackend("key")
+        backend._pool = MagicMock()
+        backend._pool.request.return_value = MagicMock(
+            status=401, data=json.dumps({"error": "Invalid API key."}).encode()
+        )
+
+        with pytest.raises(urllib3.exceptions.HTTPError, match="HTTP 401: Invalid API key"):
+            list(backend.iter_pubs("HRM", None, None, "relevance"))
+
+    def test_to_scholarly_result(self) -> None:
+        """Test that an organic result maps onto scholarly's result shape."""
+        result = _to_scholarly_result(
+            {
+                "title": "Job satisfaction",
+                "link": "https://example.com/paper",
+                "snippet": "Abstract",
+                "publication_info": {
+                    "summary": "J Doe, B Lee - Journal of HRM, 2019 - example.com",
+                    "authors": [{"name": "J Doe"}, {"name": "B Lee"}],
+                },
+                "resources": [{"file_format": "PDF", "link": "https://example.com/paper.pdf"}],
+                "inline_links": {"cited_by": {"total": 42}},
+            }
+        )
+
+        assert result == {
+            "bib": {
+                "title": "Job satisfaction",
+                "author": ["J Doe", "B Lee"],
+                "pub_year": "2019",
+                "abstract": "Abstract",
+            },
+            "num_citations": 42,
+            "eprint_url": "https://example.com/paper.pdf",
+            "pub_url": "https://example.com/paper",
+        }
+
+    def test_search_publications_uses_serpapi(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that search_publications maps SerpApi results to Publications."""
+        monkeypatch.setenv("GS_BACKEND", "serpapi")
+        monkeypatch.setenv("GS_SERPAPI_KEY", "key")
+        backend = get_backend()
+        assert isinstance(backend, SerpApiBackend)
+        backend._pool = mock_pool(make_results(2))
+
+        results = list(search_publications("HRM", limit=5))
+
+        assert [pub.title for pub in results] == ["Paper 0", "Paper 1"]
+        assert results[0].citations == 0
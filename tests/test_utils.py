@@ -4,7 +4,17 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
-from google_scholar_tool.utils import get_greeting
+import io
+import json
+from collections.abc import Iterator
+
+import pytest
+
+from google_scholar_tool import utils
+from google_scholar_tool.utils import get_greeting, json_dump_stream, json_dumps
+from tests.helpers import make_book
+
+SAMPLE = [{"title": "Über Paper", "authors": ["Author"], "year": None, "citations": 3}]
 
 
 def test_get_greeting() -> None:
@@ -12,3 +22,56 @@ def test_get_greeting() -> None:
     result = get_greeting()
     assert result == "Hello World"
     assert isinstance(result, str)
+
+
+def test_json_dumps_matches_stdlib() -> None:
+    """Test that json_dumps output equals indented stdlib json output."""
+    assert json_dumps(SAMPLE) == json.dumps(SAMPLE, indent=2, ensure_ascii=False)
+
+
+def test_json_dumps_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that json_dumps falls back to stdlib json when orjson is missing."""
+    monkeypatch.setattr(utils, "orjson", None)
+    assert json_dumps(SAMPLE) == json.dumps(SAMPLE, indent=2, ensure_ascii=False)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_dumps_dataclasses(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    """Test that result dataclasses serialize exactly like their to_dict()."""
+    if not use_orjson:
+        monkeypatch.setattr(utils, "orjson", None)
+    book = make_book(publisher=None)
+    expected = json.dumps([book.to_dict()], indent=2, ensure_ascii=False)
+    assert json_dumps([book]) == expected
+
+
+def test_json_dumps_rejects_unknown_objects() -> None:
+    """Test that objects without to_dict() are not serializable."""
+    with pytest.raises(TypeError):
+        json_dumps([object()])
+
+
+@pytest.mark.parametrize("items", [[], SAMPLE, SAMPLE * 3])
+def test_json_dump_stream_matches_json_dumps(items: list[dict[str, object]]) -> None:
+    """Test that streaming a generator writes the same array as json_dumps."""
+    out = io.StringIO()
+
+    count = json_dump_stream((item for item in items), out)
+
+    assert count == len(items)
+    assert out.getvalue() == json_dumps(items) + "\n"
+
+
+def test_json_dump_stream_closes_array_on_error() -> None:
+    """Test that a generator failing midway still leaves a valid JSON array."""
+
+    def failing() -> Iterator[dict[str, object]]:
+        yield SAMPLE[0]
+        raise RuntimeError("rate limited")
+
+    out = io.StringIO()
+
+    with pytest.raises(RuntimeError, match="rate limited"):
+        json_dump_stream(failing(), out)
+
+    assert json.loads(out.getvalue()) == [SAMPLE[0]]